@@ -10,6 +10,7 @@ import open from 'open';
 import { execFile } from 'child_process';
 import * as os from 'os';
 import TokenStore from './token-store.js';
+import { safeEqual } from '../lib/safe-equal.js';
 import type { TokenData } from '../types.js';
 import type { Server } from 'http';
 
@@ -236,7 +237,7 @@ class OAuthManager {
           return;
         }
 
-        if (state !== expectedState) {
+        if (!safeEqual(state, expectedState)) {
           res.send(`
             <html>
               <head><title>Security Error</title></head>
@@ -9,6 +9,10 @@ import * as crypto from 'crypto';
 import * as os from 'os';
 import type { TokenData, UserInfo, EncryptedPayload } from '../types.js';
 
+// Machine-derived key is fixed for the life of the process; derive it once
+// rather than re-querying the OS user database for every TokenStore instance
+let machineKey: Buffer | null = null;
+
 class TokenStore {
   private configDir: string;
   private tokenFile: string;
@@ -22,8 +26,11 @@ class TokenStore {
 
   /** Get or generate encryption key for token storage */
   private getEncryptionKey(): Buffer {
-    const machineId = os.hostname() + os.userInfo().username;
-    return crypto.createHash('sha256').update(machineId).digest();
+    if (!machineKey) {
+      const machineId = os.hostname() + os.userInfo().username;
+      machineKey = crypto.createHash('sha256').update(machineId).digest();
+    }
+    return machineKey;
   }
 
   /** Ensure config directory exists */
@@ -115,9 +122,12 @@ class TokenStore {
     }
   }
 
-  /** Get user info from stored token */
-  async getUserInfo(): Promise<UserInfo | null> {
-    const token = await this.getToken();
+  /**
+   * Get user info from stored token. Callers that already hold the token from
+   * getToken() pass it in to skip a second read and decrypt of the file.
+   */
+  async getUserInfo(stored?: TokenData | null): Promise<UserInfo | null> {
+    const token = stored === undefined ? await this.getToken() : stored;
     if (!token) return null;
 
     return {
@@ -20,7 +20,6 @@ const TAG = 'first_msg';
 function countUserMessages(transcriptPath: string): number {
   try {
     const expanded = transcriptPath.replace(/^~/, os.homedir());
-    if (!fs.existsSync(expanded)) return 0;
     const raw = fs.readFileSync(expanded, 'utf8').trim();
     if (!raw) return 0;
 
@@ -12,6 +12,7 @@
 import * as fs from 'node:fs';
 import * as path from 'node:path';
 import * as https from 'node:https';
+import type { IncomingMessage } from 'node:http';
 import * as crypto from 'node:crypto';
 import * as os from 'node:os';
 
@@ -142,46 +143,63 @@ export function errLog(tag: string, msg: string): void {
 
 const STATE_KEY_MAX_AGE_MS = 7 * 24 * 60 * 60 * 1000; // 7 days
 
+// Parsed state, kept for the life of the hook process. A session-start run
+// reads state up to three times (recall bookkeeping, update check, auto-update)
+// and the file accumulates per-session keys; each read used to re-parse it.
+// writeState() keeps this in step with what was last written.
+let _stateCache: { file: string; state: Record<string, unknown> } | null = null;
+
 export function readState(): Record<string, unknown> {
+  if (_stateCache?.file === _paths.stateFile) return _stateCache.state;
+  let state: Record<string, unknown>;
   try {
-    return JSON.parse(fs.readFileSync(_paths.stateFile, 'utf8'));
+    state = JSON.parse(fs.readFileSync(_paths.stateFile, 'utf8'));
   } catch (e: unknown) {
     if ((e as NodeJS.ErrnoException).code !== 'ENOENT') {
       errLog('state', `corrupted state file, resetting: ${(e as Error).message}`);
     }
-    return {};
+    state = {};
   }
+  _stateCache = { file: _paths.stateFile, state };
+  return state;
 }
 
 export function writeState(state: Record<string, unknown>): void {
   try {
     const dir = path.dirname(_paths.stateFile);
     fs.mkdirSync(dir, { recursive: true });
-    const tmp = _paths.stateFile + '.tmp';
+    // Per-process temp file: hooks from concurrent sessions write state in
+    // parallel, and a shared `.tmp` let one process rename another's half-
+    // written file (or fail with ENOENT). rename() itself is atomic.
+    const tmp = `${_paths.stateFile}.${process.pid}.tmp`;
     fs.writeFileSync(tmp, JSON.stringify(state), 'utf8');
     fs.renameSync(tmp, _paths.stateFile);
+    _stateCache = { file: _paths.stateFile, state };
   } catch (e: unknown) {
     errLog('state', `write failed: ${(e as Error).message}`);
   }
 }
 
+const SESSION_KEY_RE = /^(?:session_recall_|banner_shown_|hb_count_|cd_|stop_|precompact_)/;
+const SESSION_KEY_PREFIX_RE = /^(session_recall_|banner_shown_|hb_count_|cd_\w+_|stop_|precompact_)/;
+
 /** Remove stale per-session keys older than 7 days. */
 export function pruneState(state: Record<string, unknown>): Record<string, unknown> {
   const now = Date.now();
-  const prefixes = ['session_recall_', 'banner_shown_', 'hb_count_', 'cd_', 'stop_', 'precompact_'];
+  const cutoff = now - STATE_KEY_MAX_AGE_MS;
+  // Keys with a recent numeric timestamp are never pruned below, so collect
+  // them once instead of rescanning the whole state for every non-numeric key
+  const recentKeys = Object.keys(state).filter(k => typeof state[k] === 'number' && (state[k] as number) > cutoff);
   let pruned = 0;
   for (const key of Object.keys(state)) {
-    const isSessionKey = prefixes.some(p => key.startsWith(p));
-    if (!isSessionKey) continue;
+    if (!SESSION_KEY_RE.test(key)) continue;
     const val = state[key];
-    if (typeof val === 'number' && val < now - STATE_KEY_MAX_AGE_MS) {
+    if (typeof val === 'number' && val < cutoff) {
       delete state[key];
       pruned++;
     } else if (typeof val !== 'number') {
-      const sessionId = key.replace(/^(session_recall_|banner_shown_|hb_count_|cd_\w+_|stop_|precompact_)/, '');
-      const hasRecentActivity = Object.keys(state).some(k =>
-        k.endsWith(sessionId) && typeof state[k] === 'number' && (state[k] as number) > now - STATE_KEY_MAX_AGE_MS
-      );
+      const sessionId = key.replace(SESSION_KEY_PREFIX_RE, '');
+      const hasRecentActivity = recentKeys.some(k => k.endsWith(sessionId));
       if (!hasRecentActivity) {
         delete state[key];
         pruned++;
@@ -202,8 +220,9 @@ function getEncryptionKey(): Buffer {
 export function loadApiKey(): string | null {
   try {
     if (process.env.PURMEMO_API_KEY) return process.env.PURMEMO_API_KEY;
+    // A missing file throws ENOENT into the catch below — no separate
+    // existsSync probe (an extra syscall that could also race the read)
     const tokenFile = path.join(os.homedir(), '.purmemo', 'auth.json');
-    if (!fs.existsSync(tokenFile)) return null;
     const encryptedData = JSON.parse(fs.readFileSync(tokenFile, 'utf8'));
     const iv = Buffer.from(encryptedData.iv, 'hex');
     const decipher = crypto.createDecipheriv('aes-256-cbc', getEncryptionKey(), iv);
@@ -218,7 +237,7 @@ export function loadApiKey(): string | null {
 /** Read Claude Code JSONL or Gemini JSON transcript */
 export function readTranscript(transcriptPath: string | undefined): TranscriptEntry[] {
   try {
-    if (!transcriptPath || !fs.existsSync(transcriptPath)) return [];
+    if (!transcriptPath) return [];
     const raw = fs.readFileSync(transcriptPath, 'utf8').trim();
     if (!raw) return [];
 
@@ -302,6 +321,53 @@ export function buildContent(messages: Message[]): string {
 
 // ─── HTTP helpers ────────────────────────────────────────────────────────────
 
+// One keep-alive agent for every API call a hook makes, so the recall hook's
+// parallel GETs and follow-up requests share TLS connections instead of each
+// paying a fresh handshake (Node 18's global agent does not keep alive).
+// Idle sockets are unref'd by the agent and don't hold the process open.
+// Pool is capped explicitly: hooks never have more than a handful of requests
+// in flight, and LIFO reuse keeps traffic on the warmest connection.
+const apiAgent = new https.Agent({
+  keepAlive: true,
+  keepAliveMsecs: 30_000,
+  maxSockets: 8,
+  maxFreeSockets: 4,
+  scheduling: 'lifo',
+});
+
+// Responses larger than this are abandoned rather than buffered — a hook is a
+// short-lived process and never needs more than a page of memories.
+const MAX_RESPONSE_BYTES = 8 * 1024 * 1024;
+
+/**
+ * Buffer a response body, tracking its size as chunks arrive so the final
+ * concat is a single copy, and stopping early once it passes
+ * MAX_RESPONSE_BYTES (done receives null).
+ */
+function readBody(res: IncomingMessage, done: (text: string | null) => void): void {
+  if (Number(res.headers['content-length']) > MAX_RESPONSE_BYTES) {
+    res.destroy();
+    done(null);
+    return;
+  }
+  const chunks: Buffer[] = [];
+  let size = 0;
+  res.on('data', (chunk: Buffer) => {
+    size += chunk.length;
+    if (size > MAX_RESPONSE_BYTES) {
+      res.destroy();
+      done(null);
+      return;
+    }
+    chunks.push(chunk);
+  });
+  // Small get/list responses usually arrive in one chunk — decode it directly
+  // instead of copying it into a fresh buffer first
+  res.on('end', () => done(
+    (chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, size)).toString('utf8')
+  ));
+}
+
 export function apiGet(apiKey: string, urlPath: string, timeout = 8000): Promise<Record<string, unknown> | null> {
   return new Promise((resolve) => {
     const url = new URL(urlPath, API_URL);
@@ -312,12 +378,16 @@ export function apiGet(apiKey: string, urlPath: string, timeout = 8000): Promise
       method: 'GET',
       headers: { 'Authorization': `Bearer ${apiKey}` },
       timeout,
+      agent: apiAgent,
     }, (res) => {
-      const chunks: Buffer[] = [];
-      res.on('data', (chunk: Buffer) => chunks.push(chunk));
-      res.on('end', () => {
+      readBody(res, (text) => {
+        if (text === null) {
+          errLog('api', `GET ${urlPath} → response exceeds ${MAX_RESPONSE_BYTES} bytes`);
+          resolve(null);
+          return;
+        }
         try {
-          const body = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+          const body = JSON.parse(text);
           if (res.statusCode && res.statusCode >= 400) {
             errLog('api', `GET ${urlPath} → ${res.statusCode}: ${body?.error || body?.message || 'unknown'}`);
             resolve(null);
@@ -338,7 +408,9 @@ export function apiGet(apiKey: string, urlPath: string, timeout = 8000): Promise
 
 export function apiPost(apiKey: string, urlPath: string, payload: unknown, timeout = 15000): Promise<Record<string, unknown> | null> {
   return new Promise((resolve) => {
-    const body = JSON.stringify(payload);
+    // Encode once: Content-Length and the socket write share the same bytes
+    // instead of measuring the string and then re-encoding it on write.
+    const body = Buffer.from(JSON.stringify(payload), 'utf8');
     const url = new URL(urlPath, API_URL);
     const req = https.request({
       hostname: url.hostname,
@@ -348,15 +420,19 @@ export function apiPost(apiKey: string, urlPath: string, payload: unknown, timeo
       headers: {
         'Authorization': `Bearer ${apiKey}`,
         'Content-Type': 'application/json',
-        'Content-Length': Buffer.byteLength(body),
+        'Content-Length': body.length,
       },
       timeout,
+      agent: apiAgent,
     }, (res) => {
-      const chunks: Buffer[] = [];
-      res.on('data', (chunk: Buffer) => chunks.push(chunk));
-      res.on('end', () => {
+      readBody(res, (text) => {
+        if (text === null) {
+          errLog('api', `POST ${urlPath} → response exceeds ${MAX_RESPONSE_BYTES} bytes`);
+          resolve(null);
+          return;
+        }
         try {
-          const parsed = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+          const parsed = JSON.parse(text);
           if (res.statusCode && res.statusCode >= 400) {
             errLog('api', `POST ${urlPath} → ${res.statusCode}: ${parsed?.error || parsed?.message || 'unknown'}`);
             resolve(null);
@@ -380,6 +456,7 @@ export function apiPost(apiKey: string, urlPath: string, payload: unknown, timeo
 
 const MAX_CONTENT = 90_000;  // stay under API's 100K Zod limit per chunk
 const CHUNK_SIZE  = 20_000;  // match MCP server's chunk size
+const CHUNK_UPLOAD_BATCH = 4; // parts uploaded concurrently (matches MCP server default)
 
 export function shouldChunk(content: string): boolean {
   return content.length > MAX_CONTENT;
@@ -420,20 +497,30 @@ export async function saveChunked(
 ): Promise<boolean> {
   const chunks = chunkContent(content);
   const totalParts = chunks.length;
+  const partTags = [...tags, 'chunked-conversation', `session:${conversationId}`];
   let success = true;
 
-  for (let i = 0; i < chunks.length; i++) {
-    const partNumber = i + 1;
-    const result = await apiPost(apiKey, '/api/v1/memories/', {
-      content: chunks[i],
-      title: `${title} (${partNumber}/${totalParts})`,
-      conversation_id: `${conversationId}:part:${partNumber}`,
-      platform: 'claude-code',
-      tags: [...tags, 'chunked-conversation', `session:${conversationId}`],
-      metadata: { ...metadata, captureType: 'chunked', partNumber, totalParts, chunkSize: chunks[i].length },
-    });
-    if (!result?.id && !result?.memory_id) success = false;
-  }
+  // Upload parts over the shared keep-alive agent, up to CHUNK_UPLOAD_BATCH at
+  // a time — parts are independent, only the index waits on them. Each worker
+  // takes the next part as soon as its own upload finishes, so one slow part
+  // no longer holds back the whole following batch.
+  let next = 0;
+  const uploadWorker = async (): Promise<void> => {
+    while (next < totalParts) {
+      const i = next++;
+      const partNumber = i + 1;
+      const result = await apiPost(apiKey, '/api/v1/memories/', {
+        content: chunks[i],
+        title: `${title} (${partNumber}/${totalParts})`,
+        conversation_id: `${conversationId}:part:${partNumber}`,
+        platform: 'claude-code',
+        tags: partTags,
+        metadata: { ...metadata, captureType: 'chunked', partNumber, totalParts, chunkSize: chunks[i].length },
+      });
+      if (!result?.id && !result?.memory_id) success = false;
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(CHUNK_UPLOAD_BATCH, totalParts) }, uploadWorker));
 
   // Create index
   const indexContent = `# ${title} - Index\n\nParts: ${totalParts}\nSize: ${content.length} chars\nSaved: ${new Date().toISOString()}\n\n${chunks.map((c, i) => `- Part ${i + 1}: ${c.length} chars`).join('\n')}`;
@@ -552,9 +639,15 @@ export async function autoUpdateHooks(): Promise<boolean> {
 // ─── Hook stdin reader ───────────────────────────────────────────────────────
 
 export async function readHookInput(): Promise<HookInput | null> {
+  // Hook payloads usually arrive in one read; decode that buffer directly
+  // rather than concatenating into a copy first (same as readBody)
   const chunks: Buffer[] = [];
-  for await (const chunk of process.stdin) chunks.push(chunk as Buffer);
-  const text = Buffer.concat(chunks).toString('utf8').trim();
+  let size = 0;
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk as Buffer);
+    size += (chunk as Buffer).length;
+  }
+  const text = (chunks.length === 1 ? chunks[0] : Buffer.concat(chunks, size)).toString('utf8').trim();
   if (!text) return null;
   return JSON.parse(text) as HookInput;
 }
@@ -2,23 +2,26 @@
 /**
  * API client utilities for purmemo MCP server.
  *
- * Exports: sanitizeUnicode, makeApiCall, safeErrorMessage,
+ * Exports: sanitizeUnicode, makeApiCall, makeCachedApiCall, safeErrorMessage,
  *          CircuitBreaker, CircuitBreakerOpenError, apiCircuitBreaker
  *
  * Call initApiClient({ apiUrl }) before first makeApiCall.
  */
 
-import { structuredLog } from './logger.js';
+import { structuredLog, DEBUG } from './logger.js';
 
 // ============================================================================
 // Module state — set via initApiClient()
 // ============================================================================
 
 let API_URL = '';
+let USER_AGENT = null;
 let _resolveApiKey = () => null;
 
-export function initApiClient({ apiUrl, resolveApiKey }) {
+export function initApiClient({ apiUrl, resolveApiKey, userAgent = null }) {
   API_URL = apiUrl;
+  USER_AGENT = userAgent;
+  _headersKey = null; // base headers depend on USER_AGENT — rebuild on next call
   if (resolveApiKey) _resolveApiKey = resolveApiKey;
 }
 
@@ -134,6 +137,16 @@ export function safeErrorMessage(error) {
 // Unicode Sanitization
 // ============================================================================
 
+// Any character the rewrite below could change. Surrogates are matched paired
+// or not — valid pairs fall through to the full path, which leaves them intact.
+const NEEDS_SANITIZE = /[\uD800-\uDFFF\uFFFE\uFFFF\x00-\x08\x0B\x0C\x0E-\x1F\x7F]/;
+// Everything to rewrite, in one alternation so the text is scanned and copied
+// once: an unpaired high surrogate, an unpaired low surrogate, or a
+// non-character / control character (except \n, \r, \t)
+const SANITIZE_RE = /[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?<![\uD800-\uDBFF])[\uDC00-\uDFFF]|[\uFFFE\uFFFF\x00-\x08\x0B\x0C\x0E-\x1F\x7F]/g;
+// Unpaired surrogates become U+FFFD; everything else matched is dropped
+const sanitizeMatch = (ch) => (ch >= '\uD800' && ch <= '\uDFFF' ? '\uFFFD' : '');
+
 /**
  * Removes unpaired surrogates, non-characters, and control characters.
  * Fixes "no low surrogate" errors by removing unpaired surrogates and other invalid chars.
@@ -141,13 +154,13 @@ export function safeErrorMessage(error) {
 export function sanitizeUnicode(text) {
   if (!text || typeof text !== 'string') return text;
 
+  // Fast path: a test-only scan for the common case of already-clean text
+  if (!NEEDS_SANITIZE.test(text)) return text;
+
   try {
-    // Replace unpaired surrogates with replacement character
-    // High surrogates: 0xD800-0xDBFF, Low surrogates: 0xDC00-0xDFFF
-    return text.replace(/[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?:[^\uD800-\uDBFF]|^)[\uDC00-\uDFFF]/g, '\uFFFD')
-               // Also remove other problematic characters
-               .replace(/\uFFFE|\uFFFF/g, '') // Non-characters
-               .replace(/[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]/g, ''); // Control characters except \n, \r, \t
+    // Single pass over the text. (The old lone-low-surrogate pattern also
+    // consumed the character before it, silently dropping that character.)
+    return text.replace(SANITIZE_RE, sanitizeMatch);
   } catch (error) {
     structuredLog.error('Error sanitizing text', { error_message: error.message });
     // Fallback: try to encode/decode to fix encoding issues
@@ -164,6 +177,41 @@ export function sanitizeUnicode(text) {
 // API Call with Circuit Breaker + Timeout
 // ============================================================================
 
+// Base headers for the last key seen. Stdio mode always uses the same key, so
+// this builds the Authorization string once instead of on every request.
+// The object is frozen and shared — never mutate it, spread it instead.
+// User-Agent identifies this client in backend logs (same format as remote mode).
+let _headersKey = null;
+let _baseHeaders = null;
+
+function baseHeadersFor(apiKey) {
+  if (apiKey !== _headersKey) {
+    _headersKey = apiKey;
+    const headers = {
+      'Authorization': `Bearer ${apiKey}`,
+      'Content-Type': 'application/json'
+    };
+    if (USER_AGENT) headers['User-Agent'] = USER_AGENT;
+    _baseHeaders = Object.freeze(headers);
+  }
+  return _baseHeaders;
+}
+
+// Transient upstream failures worth retrying. Only idempotent methods are
+// retried — a POST that timed out at the gateway may still have been applied.
+const RETRYABLE_STATUSES = new Set([500, 502, 503, 504]);
+const MAX_RETRIES = 2;
+const RETRY_BASE_MS = 250;
+const RETRY_CAP_MS = 4000;
+
+// Full-jitter backoff (uniform in [0, base * 2^attempt], capped) so clients
+// that failed together don't retry in lockstep. A numeric Retry-After wins.
+function retryDelayMs(attempt, retryAfter = null) {
+  const seconds = Number(retryAfter);
+  if (retryAfter && Number.isFinite(seconds)) return Math.min(RETRY_CAP_MS, seconds * 1000);
+  return Math.random() * Math.min(RETRY_CAP_MS, RETRY_BASE_MS * 2 ** attempt);
+}
+
 // SECURITY: apiKeyOverride allows per-request API key (concurrency-safe)
 // instead of mutating a global resolvedApiKey
 export async function makeApiCall(endpoint, options = {}, apiKeyOverride = null) {
@@ -187,28 +235,57 @@ export async function makeApiCall(endpoint, options = {}, apiKeyOverride = null)
   return await apiCircuitBreaker.execute(async () => {
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 30000);
+    // Set once the error response has been logged, so the catch below
+    // doesn't report the same failure a second time
+    let errorStatus = 0;
 
     try {
-      const response = await fetch(`${API_URL}${endpoint}`, {
+      const init = {
         ...options,
         signal: controller.signal,
-        headers: {
-          'Authorization': `Bearer ${effectiveKey}`,
-          'Content-Type': 'application/json',
-          ...options.headers
+        headers: options.headers
+          ? { ...baseHeadersFor(effectiveKey), ...options.headers }
+          : baseHeadersFor(effectiveKey)
+      };
+      const idempotent = method === 'GET' || method === 'HEAD';
+
+      // Retries share the single 30s deadline above
+      let response;
+      for (let attempt = 0; ; attempt++) {
+        let delayMs;
+        try {
+          response = await fetch(`${API_URL}${endpoint}`, init);
+          if (!idempotent || attempt >= MAX_RETRIES || !RETRYABLE_STATUSES.has(response.status)) break;
+          await response.body?.cancel();
+          delayMs = retryDelayMs(attempt, response.headers.get('retry-after'));
+        } catch (error) {
+          if (!idempotent || attempt >= MAX_RETRIES || error.name === 'AbortError') throw error;
+          delayMs = retryDelayMs(attempt);
         }
-      });
+        structuredLog.warn('API call retrying', {
+          request_id: requestId,
+          endpoint,
+          attempt: attempt + 1,
+          status: response?.status ?? null,
+          delay_ms: Math.round(delayMs)
+        });
+        response = undefined;
+        await new Promise(resolve => setTimeout(resolve, delayMs));
+      }
 
       clearTimeout(timeoutId);
 
-      structuredLog.debug('API response received', {
-        request_id: requestId,
-        endpoint,
-        status: response.status,
-        status_text: response.statusText
-      });
+      if (DEBUG) {
+        structuredLog.debug('API response received', {
+          request_id: requestId,
+          endpoint,
+          status: response.status,
+          status_text: response.statusText
+        });
+      }
 
       if (!response.ok) {
+        errorStatus = response.status;
         const errorText = await response.text();
         structuredLog.warn('API error response', {
           request_id: requestId,
@@ -266,13 +343,16 @@ export async function makeApiCall(endpoint, options = {}, apiKeyOverride = null)
         throw new Error(`API Error ${response.status}: ${errorText}`);
       }
 
-      const data = await response.json();
+      // Read the body once and log its length — re-stringifying the parsed
+      // response just to measure it cost a full serialisation per call
+      const bodyText = await response.text();
+      const data = JSON.parse(bodyText);
 
       structuredLog.info('API call successful', {
         request_id: requestId,
         endpoint,
         response_keys: Object.keys(data).length,
-        response_size_bytes: JSON.stringify(data).length
+        response_size_bytes: bodyText.length
       });
 
       return data;
@@ -289,6 +369,8 @@ export async function makeApiCall(endpoint, options = {}, apiKeyOverride = null)
         throw new Error('Request timeout after 30 seconds');
       }
 
+      if (errorStatus) throw error;
+
       structuredLog.error('API call exception', {
         request_id: requestId,
         endpoint,
@@ -300,3 +382,34 @@ export async function makeApiCall(endpoint, options = {}, apiKeyOverride = null)
     }
   });
 }
+
+// ============================================================================
+// Short-lived GET cache for near-static per-user data
+// ============================================================================
+
+// Profile/identity data (/auth/me) changes rarely but was refetched by every
+// get_user_context and run_workflow call. Entries are keyed by API key +
+// endpoint, so users never share results; the in-flight promise is stored, so
+// concurrent callers share one request. Failures are not cached.
+const CACHED_GET_MAX = 256;
+const _cachedGets = new Map();
+
+export function makeCachedApiCall(endpoint, ttlMs, apiKeyOverride = null) {
+  const key = `${apiKeyOverride || _resolveApiKey()}\n${endpoint}`;
+  const now = Date.now();
+  const hit = _cachedGets.get(key);
+  if (hit && hit.expiresAt > now) return hit.promise;
+
+  const promise = makeApiCall(endpoint, {}, apiKeyOverride);
+  _cachedGets.set(key, { expiresAt: now + ttlMs, promise });
+  promise.catch(() => {
+    if (_cachedGets.get(key)?.promise === promise) _cachedGets.delete(key);
+  });
+  if (_cachedGets.size > CACHED_GET_MAX) {
+    for (const [k, entry] of _cachedGets) {
+      if (entry.expiresAt <= now) _cachedGets.delete(k);
+    }
+    if (_cachedGets.size > CACHED_GET_MAX) _cachedGets.delete(_cachedGets.keys().next().value);
+  }
+  return promise;
+}
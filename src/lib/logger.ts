@@ -4,6 +4,19 @@
  * All log output goes to stderr (keeps stdout clean for MCP protocol).
  */
 
+const LEVELS = { debug: 10, info: 20, warn: 30, error: 40 };
+
+// Threshold is fixed at import (PURMEMO_LOG_LEVEL, default "info"; PURMEMO_DEBUG=1
+// forces "debug"). Levels below it are bound to a no-op once, so disabled
+// call sites pay no level check at runtime.
+const MIN_LEVEL = process.env.PURMEMO_DEBUG === '1'
+  ? LEVELS.debug
+  : (LEVELS[(process.env.PURMEMO_LOG_LEVEL || '').toLowerCase()] ?? LEVELS.info);
+
+// Debug logging is opt-in. Exported so hot-path call sites can guard with
+// `if (DEBUG)` and skip building the context object.
+export const DEBUG = MIN_LEVEL <= LEVELS.debug;
+
 export function logStructured(level, message, context = {}) {
   const entry = {
     timestamp: new Date().toISOString(),
@@ -14,9 +27,16 @@ export function logStructured(level, message, context = {}) {
   console.error(JSON.stringify(entry));
 }
 
+function noop() {}
+
+function levelLogger(level) {
+  if (LEVELS[level] < MIN_LEVEL) return noop;
+  return (message, context) => logStructured(level, message, context);
+}
+
 export const structuredLog = {
-  info: (msg, ctx = {}) => logStructured('info', msg, ctx),
-  warn: (msg, ctx = {}) => logStructured('warn', msg, ctx),
-  error: (msg, ctx = {}) => logStructured('error', msg, ctx),
-  debug: (msg, ctx = {}) => logStructured('debug', msg, ctx)
+  info: levelLogger('info'),
+  warn: levelLogger('warn'),
+  error: levelLogger('error'),
+  debug: levelLogger('debug')
 };
@@ -0,0 +1,50 @@
+/**
+ * Fixed-capacity ring buffer for bounded history (events, errors, failures).
+ *
+ * push() is O(1) and overwrites the oldest entry once full — unlike
+ * Array#push + Array#shift, which re-indexes the whole array on every
+ * eviction. Iteration yields entries oldest → newest.
+ */
+
+export class RingBuffer<T> {
+  public readonly capacity: number;
+  private readonly items: Array<T | undefined>;
+  private head: number;
+  private size: number;
+
+  constructor(capacity: number) {
+    this.capacity = capacity;
+    this.items = new Array(capacity);
+    this.head = 0;
+    this.size = 0;
+  }
+
+  get length(): number {
+    return this.size;
+  }
+
+  push(item: T): void {
+    this.items[(this.head + this.size) % this.capacity] = item;
+    if (this.size < this.capacity) {
+      this.size++;
+    } else {
+      this.head = (this.head + 1) % this.capacity;
+    }
+  }
+
+  /** Newest `n` entries, oldest first (same order as Array#slice(-n)) */
+  last(n: number): T[] {
+    const count = Math.min(n, this.size);
+    const out: T[] = new Array(count);
+    for (let i = 0; i < count; i++) {
+      out[i] = this.items[(this.head + this.size - count + i) % this.capacity] as T;
+    }
+    return out;
+  }
+
+  *[Symbol.iterator](): IterableIterator<T> {
+    for (let i = 0; i < this.size; i++) {
+      yield this.items[(this.head + i) % this.capacity] as T;
+    }
+  }
+}
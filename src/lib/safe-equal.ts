@@ -0,0 +1,24 @@
+/**
+ * Constant-time string comparison for secrets (PKCE verifiers, OAuth state).
+ *
+ * `===` returns at the first differing character, so response timing leaks
+ * how much of a guess was right. Both sides are hashed first: the digests
+ * are always 32 bytes, which timingSafeEqual requires, and the compare no
+ * longer reveals the secret's length either.
+ */
+
+import * as crypto from 'node:crypto';
+
+/**
+ * One-shot SHA-256 digest. crypto.hash() (Node >= 21.7) hashes in a single
+ * native call without allocating a Hash object; older runtimes fall back to
+ * createHash().
+ */
+export const sha256: (data: string) => Buffer = typeof crypto.hash === 'function'
+  ? (data) => crypto.hash('sha256', data, 'buffer') as unknown as Buffer
+  : (data) => crypto.createHash('sha256').update(data, 'utf8').digest();
+
+export function safeEqual(a: string, b: string): boolean {
+  if (typeof a !== 'string' || typeof b !== 'string') return false;
+  return crypto.timingSafeEqual(sha256(a), sha256(b));
+}
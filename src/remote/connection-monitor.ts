@@ -4,6 +4,7 @@
  */
 
 import type { ConnectionInfo, ConnectionEvent, ConnectionRate, ConnectionMetrics, ConnectionSummary } from '../types.js';
+import { RingBuffer } from '../lib/ring-buffer.js';
 
 interface AuthFailureEntry {
   timestamp: number;
@@ -12,8 +13,8 @@ interface AuthFailureEntry {
 
 export class ConnectionMonitor {
   private activeConnections: Map<string, ConnectionInfo>;
-  private connectionEvents: ConnectionEvent[];
-  private authFailures: AuthFailureEntry[];
+  private connectionEvents: RingBuffer<ConnectionEvent>;
+  private authFailures: RingBuffer<AuthFailureEntry>;
   private toolUsage: Map<string, Record<string, number>>;
   public totalConnections: number;
   public successfulConnections: number;
@@ -21,12 +22,12 @@ export class ConnectionMonitor {
   public totalAuthFailures: number;
   private alertThreshold: number;
   private alertsSent: Set<string>;
-  private _monitorInterval: ReturnType<typeof setInterval> | null;
+  private _alertsEnabled: boolean;
 
   constructor(alertThreshold: number = 100) {
     this.activeConnections = new Map();
-    this.connectionEvents = [];
-    this.authFailures = [];
+    this.connectionEvents = new RingBuffer(300);
+    this.authFailures = new RingBuffer(100);
     this.toolUsage = new Map();
     this.totalConnections = 0;
     this.successfulConnections = 0;
@@ -34,35 +35,44 @@ export class ConnectionMonitor {
     this.totalAuthFailures = 0;
     this.alertThreshold = alertThreshold;
     this.alertsSent = new Set();
-    this._monitorInterval = null;
+    this._alertsEnabled = false;
   }
 
+  // Alerts are evaluated when a connect/auth-failure event is recorded — the
+  // only moments an alert condition can newly become true — instead of on a
+  // 30s timer that woke the process even when idle.
   start(): void {
-    this._monitorInterval = setInterval(() => this._checkAlerts(), 30000);
+    this._alertsEnabled = true;
   }
 
   stop(): void {
-    if (this._monitorInterval) clearInterval(this._monitorInterval);
+    this._alertsEnabled = false;
   }
 
-  trackConnection(connId: string, info: Record<string, unknown> = {}): void {
+  trackConnection(connId: string, info: { type?: string } = {}): void {
     this.totalConnections++;
     this.successfulConnections++;
+    const now = Date.now();
+    // Explicit fields (no spread) so every entry shares one object shape and
+    // property reads in trackToolCall/getSummary stay monomorphic
     this.activeConnections.set(connId, {
-      ...info,
-      connectedAt: Date.now(),
-      lastActivity: Date.now(),
+      type: info.type,
+      connectedAt: now,
+      lastActivity: now,
       toolCalls: {},
+      totalToolCalls: 0,
       errors: 0
     });
-    this._addEvent({ type: 'connect', connId, success: true, timestamp: Date.now() });
+    this._addEvent({ type: 'connect', connId, success: true, timestamp: now });
     this.toolUsage.set(connId, {});
+    if (this._alertsEnabled) this._checkAlerts();
   }
 
   trackDisconnection(connId: string): void {
     const conn = this.activeConnections.get(connId);
     if (!conn) return;
-    this._addEvent({ type: 'disconnect', connId, duration: Date.now() - conn.connectedAt, timestamp: Date.now() });
+    const now = Date.now();
+    this._addEvent({ type: 'disconnect', connId, duration: now - conn.connectedAt, timestamp: now });
     this.activeConnections.delete(connId);
     this.toolUsage.delete(connId);
   }
@@ -70,9 +80,10 @@ export class ConnectionMonitor {
   trackAuthFailure(info: Record<string, unknown> = {}): void {
     this.totalAuthFailures++;
     this.failedConnections++;
-    this.authFailures.push({ ...info, timestamp: Date.now() });
-    if (this.authFailures.length > 100) this.authFailures.shift();
-    this._addEvent({ type: 'connect', success: false, reason: 'auth_failure', timestamp: Date.now() });
+    const now = Date.now();
+    this.authFailures.push({ ...info, timestamp: now });
+    this._addEvent({ type: 'connect', success: false, reason: 'auth_failure', timestamp: now });
+    if (this._alertsEnabled) this._checkAlerts();
   }
 
   trackToolCall(connId: string, toolName: string, success: boolean = true): void {
@@ -80,24 +91,35 @@ export class ConnectionMonitor {
     if (conn) {
       conn.lastActivity = Date.now();
       conn.toolCalls[toolName] = (conn.toolCalls[toolName] || 0) + 1;
+      conn.totalToolCalls++;
       if (!success) conn.errors++;
     }
-    const usage = this.toolUsage.get(connId) || {};
+    // Insert the per-connection record only when it's missing; existing
+    // records are updated in place rather than re-set on every call
+    let usage = this.toolUsage.get(connId);
+    if (!usage) {
+      usage = {};
+      this.toolUsage.set(connId, usage);
+    }
     usage[toolName] = (usage[toolName] || 0) + 1;
-    this.toolUsage.set(connId, usage);
   }
 
   private _addEvent(event: ConnectionEvent): void {
     this.connectionEvents.push(event);
-    if (this.connectionEvents.length > 300) this.connectionEvents.shift();
   }
 
   getConnectionRate(windowSec: number = 300): ConnectionRate {
     const cutoff = Date.now() - windowSec * 1000;
-    const events = this.connectionEvents.filter(e => e.timestamp > cutoff);
-    const connects = events.filter(e => e.type === 'connect' && e.success).length;
-    const failures = events.filter(e => e.type === 'connect' && !e.success).length;
-    const disconnects = events.filter(e => e.type === 'disconnect').length;
+    // Single pass, no intermediate arrays (was one filter per counter)
+    let connects = 0;
+    let failures = 0;
+    let disconnects = 0;
+    for (const e of this.connectionEvents) {
+      if (e.timestamp <= cutoff) continue;
+      if (e.type === 'disconnect') disconnects++;
+      else if (e.success) connects++;
+      else failures++;
+    }
     const total = connects + failures;
     return {
       window_seconds: windowSec,
@@ -112,7 +134,11 @@ export class ConnectionMonitor {
   getMetrics(): ConnectionMetrics {
     const last5min = this.getConnectionRate(300);
     const last1min = this.getConnectionRate(60);
-    const recentAuthFailures = this.authFailures.filter(f => f.timestamp > Date.now() - 300000).length;
+    const authCutoff = Date.now() - 300000;
+    let recentAuthFailures = 0;
+    for (const f of this.authFailures) {
+      if (f.timestamp > authCutoff) recentAuthFailures++;
+    }
 
     return {
       active_connections: this.activeConnections.size,
@@ -134,12 +160,19 @@ export class ConnectionMonitor {
 
   getSummary(): ConnectionSummary {
     const rate = this.getConnectionRate(300);
-    const conns = Array.from(this.activeConnections.entries()).slice(0, 10).map(([id, c]) => ({
-      id: id.substring(0, 8),
-      duration_seconds: Math.floor((Date.now() - c.connectedAt) / 1000),
-      tool_calls: Object.values(c.toolCalls).reduce<number>((a, b) => a + b, 0),
-      errors: c.errors
-    }));
+    const now = Date.now();
+    // Only the first 10 are reported — stop there rather than copying every
+    // active connection into an array just to slice it
+    const conns: ConnectionSummary['connections'] = [];
+    for (const [id, c] of this.activeConnections) {
+      if (conns.length === 10) break;
+      conns.push({
+        id: id.substring(0, 8),
+        duration_seconds: Math.floor((now - c.connectedAt) / 1000),
+        tool_calls: c.totalToolCalls,
+        errors: c.errors
+      });
+    }
     return {
       active: this.activeConnections.size,
       total: this.totalConnections,
@@ -8,16 +8,20 @@
  */
 
 import * as crypto from 'node:crypto';
+import { safeEqual, sha256 } from '../lib/safe-equal.js';
 import type { AuthCodeData, StoreAuthCodeParams, ExchangeCodeParams } from '../types.js';
 
-// In-memory storage
+const CODE_TTL_MS = 10 * 60 * 1000; // 10 minutes
+
+// In-memory storage. Every code gets the same TTL, so Map insertion order is
+// also expiry order — the oldest entries are always the first to expire.
 const oauthCodes = new Map<string, AuthCodeData>();
 
-/** Remove expired codes */
-function cleanupExpired(): void {
-  const now = Date.now();
-  for (const [code, data] of Array.from(oauthCodes)) {
-    if (data.expiresAt < now) oauthCodes.delete(code);
+/** Remove expired codes (stops at the first live one — O(expired), not O(N)) */
+function cleanupExpired(now: number): void {
+  for (const [code, data] of oauthCodes) {
+    if (data.expiresAt >= now) break;
+    oauthCodes.delete(code);
   }
 }
 
@@ -28,11 +32,14 @@ export function generateCode(): string {
 
 /** Verify PKCE code challenge (S256 or plain) */
 export function verifyCodeChallenge(verifier: string, challenge: string, method: string = 'S256'): boolean {
-  if (method === 'plain') return verifier === challenge;
+  if (method === 'plain') return safeEqual(verifier, challenge);
   if (method === 'S256') {
-    const digest = crypto.createHash('sha256').update(verifier, 'utf8').digest();
-    const computed = digest.toString('base64url');
-    return computed === challenge || computed.replace(/=+$/, '') === challenge.replace(/=+$/, '');
+    // Compare raw digest bytes against the decoded challenge instead of
+    // base64url-encoding the digest and string-matching (with and without
+    // padding) — decoding ignores padding, and the compare is constant-time
+    const digest = sha256(verifier);
+    const expected = Buffer.from(challenge, 'base64url');
+    return expected.length === digest.length && crypto.timingSafeEqual(digest, expected);
   }
   return false;
 }
@@ -43,7 +50,8 @@ export function storeAuthCode({
   codeChallenge, codeChallengeMethod,
   scope = null, state = null, refreshToken = null
 }: StoreAuthCodeParams): void {
-  cleanupExpired();
+  const now = Date.now();
+  cleanupExpired(now);
   oauthCodes.set(code, {
     apiKey,
     refreshToken,
@@ -53,8 +61,8 @@ export function storeAuthCode({
     codeChallengeMethod,
     scope,
     state,
-    createdAt: Date.now(),
-    expiresAt: Date.now() + 10 * 60 * 1000, // 10 minutes
+    createdAt: now,
+    expiresAt: now + CODE_TTL_MS,
     used: false
   });
 }
@@ -64,11 +72,12 @@ export function storeAuthCode({
  * Returns [apiKey, refreshToken] or null if invalid
  */
 export function exchangeCodeForToken({ code, clientId, redirectUri, codeVerifier }: ExchangeCodeParams): [string, string | null] | null {
-  cleanupExpired();
+  const now = Date.now();
+  cleanupExpired(now);
 
   const data = oauthCodes.get(code);
   if (!data) return null;
-  if (data.expiresAt < Date.now()) { oauthCodes.delete(code); return null; }
+  if (data.expiresAt < now) { oauthCodes.delete(code); return null; }
   if (data.used) { oauthCodes.delete(code); return null; }
   if (clientId && clientId !== data.clientId) return null;
   if (redirectUri !== data.redirectUri) return null;
@@ -8,6 +8,7 @@
 
 import { structuredLog } from '../lib/logger.js';
 import { apiCircuitBreaker } from '../lib/api-client.js';
+import { RingBuffer } from '../lib/ring-buffer.js';
 import {
   handleSaveConversation,
   handleSaveArtifact,
@@ -20,6 +21,13 @@ import {
   handleReportMemory
 } from '../tools/handlers.js';
 import { handleGenerateHandoffBrief } from '../tools/handoff.js';
+import { executeBatch } from '../tools/batch.js';
+import { readFileSync } from 'node:fs';
+import { dirname, join } from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+// Static assets (login/success pages, widgets, icon) ship beside this module
+const __remoteDir = dirname(fileURLToPath(import.meta.url));
 
 export async function startRemoteServer(ctx) {
   // Destructure all server.ts dependencies — same variable names, zero body changes
@@ -45,10 +53,46 @@ export async function startRemoteServer(ctx) {
   // REMOTE MODE — Express + Streamable HTTP + SSE (replaces Python server)
   // ========================================================================
   const { default: express } = await import('express');
-  const { randomUUID } = await import('node:crypto');
+  const { randomUUID, randomBytes, createHmac } = await import('node:crypto');
+
+  // Static assets (widgets, login/success pages, icon) are read from disk on
+  // first use and served from memory afterwards — a readFileSync per request
+  // stalled the event loop for every other in-flight request.
+  const assetCache = new Map();
+  function readAsset(relPath, encoding = 'utf8') {
+    let data = assetCache.get(relPath);
+    if (data === undefined) {
+      data = readFileSync(join(__remoteDir, relPath), encoding);
+      assetCache.set(relPath, data);
+    }
+    return data;
+  }
+
+  // HTML templates are split on their <!-- NAME --> placeholders once; each
+  // render is then a single join instead of rescanning the page per marker.
+  const TEMPLATE_MARKER_RE = /<!-- ([A-Z_]+) -->/;
+  const templateCache = new Map();
+  function renderTemplate(relPath, values) {
+    let parts = templateCache.get(relPath);
+    if (parts === undefined) {
+      // split() with a capture group interleaves marker names at odd indices
+      parts = readAsset(relPath).split(new RegExp(TEMPLATE_MARKER_RE, 'g'));
+      templateCache.set(relPath, parts);
+    }
+    let html = parts[0];
+    for (let i = 1; i < parts.length; i += 2) {
+      const value = values[parts[i]];
+      html += (value === undefined ? `<!-- ${parts[i]} -->` : value) + parts[i + 1];
+    }
+    return html;
+  }
 
   const app = express();
   app.use(express.json());
+  // res.json()/res.send() otherwise SHA-1 every response body to build an
+  // ETag. Nothing here is served conditionally (health/metrics bodies change
+  // on every call, OAuth pages are one-shot), so the hash is pure overhead.
+  app.set('etag', false);
 
   // CORS — allow known MCP client origins only
   const TRUSTED_MCP_ORIGINS = [
@@ -74,13 +118,65 @@ export async function startRemoteServer(ctx) {
   const startTime = Date.now();
   let connectionCount = 0;
   let toolCallCounts = {};
-  let recentErrors = []; // last 100 errors
+  const recentErrors = new RingBuffer(100); // last 100 errors — `at` is epoch ms, formatted on read
 
   // Connection monitoring
   const { ConnectionMonitor } = await import('./connection-monitor.js');
   const connMonitor = new ConnectionMonitor(100);
   connMonitor.start();
 
+  // Static part of the /health payload — env and version are fixed for the
+  // process lifetime, so read them once rather than on every health probe
+  const SERVICE_INFO = Object.freeze({
+    version: CLIENT_VERSION,
+    runtime: 'node',
+    api_backend: API_URL,
+    environment: process.env.NODE_ENV || 'production',
+    capabilities: ['tools', 'resources', 'prompts', 'streamable-http', 'sse']
+  });
+
+  // fetch() pools keep-alive connections to the backend, but a socket only
+  // returns to the pool once its response body has been read to the end; one
+  // left unread stays checked out until GC and the next call pays a fresh TLS
+  // handshake. Status-only checks drain the (small) body in the background.
+  function releaseBody(resp) {
+    resp.arrayBuffer().catch(() => {});
+  }
+
+  // Parsed JSON of an OK response, or `fallback` (draining the failed body)
+  async function jsonOrDrain(resp, fallback) {
+    if (resp.ok) return resp.json();
+    releaseBody(resp);
+    return fallback;
+  }
+
+  // Backend requests on the authentication and tool-call paths are built from
+  // parts fixed at startup: endpoint URLs and the User-Agent are resolved once,
+  // and unauthenticated JSON posts share one (read-only) headers object
+  const AUTH_ME_URL = `${API_URL}/api/v1/auth/me`;
+  const AUTH_REFRESH_URL = `${API_URL}/api/v1/auth/refresh`;
+  const TOOLS_EXECUTE_URL = `${API_URL}/api/v10/mcp/tools/execute`;
+  const USER_AGENT = `purmemo-mcp/${CLIENT_VERSION}`;
+  const JSON_POST_HEADERS = Object.freeze({ 'Content-Type': 'application/json', 'User-Agent': USER_AGENT });
+
+  // Backend probe shared across /health requests. Liveness probes and
+  // dashboards poll concurrently; without this each poll held a request open
+  // for up to 5s on its own upstream fetch. Callers within the TTL (including
+  // those arriving while a probe is in flight) await the same result.
+  const BACKEND_PROBE_TTL_MS = 10_000;
+  let backendProbe = null;
+  function probeBackend() {
+    const now = Date.now();
+    if (backendProbe && now - backendProbe.at < BACKEND_PROBE_TTL_MS) return backendProbe.promise;
+    const promise = fetch(`${API_URL}/health`, { signal: AbortSignal.timeout(5000) })
+      .then(resp => {
+        releaseBody(resp);
+        return { status: resp.ok ? 'healthy' : 'unhealthy', latency: Date.now() - now };
+      }, () => ({ status: 'unreachable', latency: null }));
+    backendProbe = { at: now, promise };
+    return promise;
+  }
+
   // Health endpoint
   app.get('/health', async (req, res) => {
     const uptimeSeconds = Math.floor((Date.now() - startTime) / 1000);
@@ -88,14 +184,7 @@ export async function startRemoteServer(ctx) {
     const mins = Math.floor((uptimeSeconds % 3600) / 60);
     const secs = uptimeSeconds % 60;
 
-    let backendStatus = 'unknown';
-    let backendLatency = null;
-    try {
-      const t0 = Date.now();
-      const resp = await fetch(`${API_URL}/health`, { signal: AbortSignal.timeout(5000) });
-      backendLatency = Date.now() - t0;
-      backendStatus = resp.ok ? 'healthy' : 'unhealthy';
-    } catch { backendStatus = 'unreachable'; }
+    const { status: backendStatus, latency: backendLatency } = await probeBackend();
 
     const mem = process.memoryUsage();
 
@@ -115,7 +204,7 @@ export async function startRemoteServer(ctx) {
       performance: {
         error_rate_percent: 0,
         total_errors: recentErrors.length,
-        recent_errors: recentErrors.slice(-5)
+        recent_errors: recentErrors.last(5).map(({ at, ...e }) => ({ timestamp: new Date(at).toISOString(), ...e }))
       },
       backend_api: {
         url: API_URL,
@@ -126,13 +215,7 @@ export async function startRemoteServer(ctx) {
         state: apiCircuitBreaker.state,
         consecutive_failures: apiCircuitBreaker.failureCount
       },
-      service_info: {
-        version: CLIENT_VERSION,
-        runtime: 'node',
-        api_backend: API_URL,
-        environment: process.env.NODE_ENV || 'production',
-        capabilities: ['tools', 'resources', 'prompts', 'streamable-http', 'sse']
-      }
+      service_info: SERVICE_INFO
     });
   });
 
@@ -153,65 +236,158 @@ export async function startRemoteServer(ctx) {
   const mcpSessions = new Map();
   const SUPPORTED_PROTOCOL_VERSIONS = new Set(['2024-11-05', '2025-11-05', '2025-03-26']);
 
-  // Session cleanup — remove stale sessions every 5 minutes (matches Python)
+  // initialize-response fields that never change after startup — built once,
+  // not per handshake
+  const SERVER_CAPABILITIES = { tools: { listChanged: true }, resources: { subscribe: false, listChanged: false }, prompts: { listChanged: false }, logging: {} };
+  const SERVER_INFO = { name: 'purmemo-mcp', version: CLIENT_VERSION };
+  // List results are static — tools/list in particular is public and the
+  // largest payload (full descriptions and schemas) — so serialise them once
+  // rather than on every listing
+  const TOOLS_LIST_JSON = JSON.stringify({ tools: TOOLS });
+  const RESOURCES_LIST_JSON = JSON.stringify({ resources: RESOURCES, resourceTemplates: RESOURCE_TEMPLATES });
+  const PROMPTS_LIST_JSON = JSON.stringify({ prompts: PROMPTS });
+
+  // Session cleanup — remove stale sessions every 5 minutes (matches Python).
+  // Sessions are re-inserted on activity, so Map iteration order is oldest
+  // lastActivity first and the sweep can stop at the first live session.
+  // Activity is recorded at most once per SESSION_TOUCH_INTERVAL_MS: a busy
+  // session otherwise paid a Map delete+set on every request to move a
+  // timestamp that only matters at 30-minute resolution.
+  const SESSION_TOUCH_INTERVAL_MS = 60_000;
   const sessionCleanupInterval = setInterval(() => {
     const maxAge = 30 * 60 * 1000; // 30 minutes
     const now = Date.now();
     let cleaned = 0;
     for (const [sid, sess] of mcpSessions) {
-      if (now - sess.lastActivity > maxAge) {
-        mcpSessions.delete(sid);
-        cleaned++;
-      }
+      if (now - sess.lastActivity <= maxAge) break;
+      mcpSessions.delete(sid);
+      cleaned++;
     }
     if (cleaned > 0) structuredLog.info('Cleaned up stale sessions', { count: cleaned });
   }, 5 * 60 * 1000);
 
+  // Tokens the backend accepted recently. Every authenticated request used to
+  // cost an /auth/me round trip; within the TTL a token is trusted without
+  // one. Same TTL for every entry, so Map insertion order is expiry order.
+  // A 401 from the backend on a tool call evicts the token immediately.
+  const VALIDATED_TOKEN_TTL_MS = 30_000;
+  const VALIDATED_TOKEN_MAX = 1000;
+  const validatedTokens = new Map();
+  // Entries are keyed by a keyed hash, not the bearer token itself, so the
+  // cache never holds usable credentials. The key is random per process.
+  const TOKEN_KEY_SECRET = randomBytes(32);
+  function tokenCacheKey(token) {
+    return createHmac('sha256', TOKEN_KEY_SECRET).update(token).digest('base64');
+  }
+  function isRecentlyValidated(key) {
+    const now = Date.now();
+    for (const [k, expiresAt] of validatedTokens) {
+      if (expiresAt > now) break;
+      validatedTokens.delete(k);
+    }
+    return validatedTokens.has(key);
+  }
+  function rememberValidated(key) {
+    validatedTokens.delete(key);
+    validatedTokens.set(key, Date.now() + VALIDATED_TOKEN_TTL_MS);
+    if (validatedTokens.size > VALIDATED_TOKEN_MAX) {
+      validatedTokens.delete(validatedTokens.keys().next().value);
+    }
+  }
+
+  // Backend checks in flight, by token cache key. A client opening a session
+  // fires several requests at once with the same not-yet-cached token; they
+  // share one /auth/me round trip instead of each issuing their own.
+  const pendingValidations = new Map();
+
+  // Refreshes in flight, by the expired token's cache key. The backend rotates
+  // refresh tokens, so two requests racing on the same expired token must not
+  // both spend the stored one — the loser would get a 401 and drop the session.
+  const pendingRefreshes = new Map();
+
+  // Helper: exchange the refresh token stored for an expired access token.
+  // The stored entry is taken up front and the replacement written on success,
+  // so rotation is one step with no window where both tokens are on file. It is
+  // put back unless the backend rotated it or refused it (400/401) — a timeout,
+  // 429 or 5xx leaves it good for the next attempt.
+  // Resolves to the new access token, or null.
+  function refreshAccessToken(cacheKey) {
+    let pending = pendingRefreshes.get(cacheKey);
+    if (pending) return pending;
+    const stored = refreshTokenStore[cacheKey];
+    if (!stored?.token) return Promise.resolve(null);
+    delete refreshTokenStore[cacheKey];
+    pending = (async () => {
+      let spent = false;
+      try {
+        const refreshResp = await fetch(AUTH_REFRESH_URL, {
+          method: 'POST',
+          headers: JSON_POST_HEADERS,
+          body: JSON.stringify({ refresh_token: stored.token }),
+          signal: AbortSignal.timeout(10000)
+        });
+        if (!refreshResp.ok) {
+          spent = refreshResp.status === 400 || refreshResp.status === 401;
+          releaseBody(refreshResp);
+          return null;
+        }
+        spent = true;
+        const data = await refreshResp.json();
+        const newToken = data.access_token || data.api_key;
+        if (!newToken) return null;
+        const newKey = tokenCacheKey(newToken);
+        if (data.refresh_token) refreshTokenStore[newKey] = { token: data.refresh_token, createdAt: Date.now() };
+        rememberValidated(newKey);
+        return newToken;
+      } catch (e) {
+        structuredLog.warn('Silent token refresh failed', { error: e.message });
+        return null;
+      } finally {
+        if (!spent) refreshTokenStore[cacheKey] = stored;
+      }
+    })().finally(() => pendingRefreshes.delete(cacheKey));
+    pendingRefreshes.set(cacheKey, pending);
+    return pending;
+  }
+
   // Helper: validate API key from Authorization header
   async function validateApiKeyFromRequest(req) {
     const auth = req.headers.authorization;
     if (!auth || !auth.startsWith('Bearer ')) return null;
     const token = auth.split(' ')[1];
+    const cacheKey = tokenCacheKey(token);
+    if (isRecentlyValidated(cacheKey)) return token;
+    let pending = pendingValidations.get(cacheKey);
+    if (!pending) {
+      pending = validateWithBackend(token, cacheKey)
+        .finally(() => pendingValidations.delete(cacheKey));
+      pendingValidations.set(cacheKey, pending);
+    }
+    return pending;
+  }
+
+  async function validateWithBackend(token, cacheKey) {
     try {
-      const resp = await fetch(`${API_URL}/api/v1/auth/me`, {
-        headers: { 'Authorization': `Bearer ${token}`, 'User-Agent': `purmemo-mcp/${CLIENT_VERSION}` },
+      const resp = await fetch(AUTH_ME_URL, {
+        headers: { 'Authorization': `Bearer ${token}`, 'User-Agent': USER_AGENT },
         signal: AbortSignal.timeout(10000)
       });
-      if (resp.ok) return token;
-      // Silent token refresh if 401 and we have a refresh token
-      if (resp.status === 401 && refreshTokenStore[token]?.token) {
-        try {
-          const refreshResp = await fetch(`${API_URL}/api/v1/auth/refresh`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ refresh_token: refreshTokenStore[token].token }),
-            signal: AbortSignal.timeout(10000)
-          });
-          if (refreshResp.ok) {
-            const data = await refreshResp.json();
-            const newToken = data.access_token || data.api_key;
-            if (newToken) {
-              if (data.refresh_token) refreshTokenStore[newToken] = { token: data.refresh_token, createdAt: Date.now() };
-              delete refreshTokenStore[token];
-              return newToken;
-            }
-          }
-        } catch {}
+      releaseBody(resp);
+      if (resp.ok) {
+        rememberValidated(cacheKey);
+        return token;
       }
+      // Silent token refresh if 401 and we have a refresh token
+      if (resp.status === 401) return await refreshAccessToken(cacheKey);
       return null;
     } catch { return null; }
   }
 
-  // Helper: SSE response
+  // Helper: SSE response — headers are prebuilt, and the event is sent with a
+  // single end() so body and terminating chunk leave in one write
   function sendSSE(res, data) {
-    res.writeHead(200, {
-      'Content-Type': 'text/event-stream',
-      'Cache-Control': 'no-cache',
-      'Connection': 'keep-alive',
-      ...CORS_HEADERS
-    });
-    res.write(`data: ${JSON.stringify(data)}\n\n`);
-    res.end();
+    res.writeHead(200, SSE_HEADERS);
+    res.end(`data: ${JSON.stringify(data)}\n\n`);
   }
 
   // SECURITY: No wildcard CORS — reflect only trusted origins
@@ -231,94 +407,114 @@ export async function startRemoteServer(ctx) {
     };
   }
   const CORS_HEADERS = getCorsHeaders(null);
+  const SSE_HEADERS = {
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    'Connection': 'keep-alive',
+    ...CORS_HEADERS
+  };
 
   // Helper: JSON response with CORS
-  function sendJSON(res, data, statusCode = 200, extraHeaders = {}) {
-    res.writeHead(statusCode, {
-      'Content-Type': 'application/json',
-      ...CORS_HEADERS,
-      ...extraHeaders
-    });
+  const JSON_HEADERS = { 'Content-Type': 'application/json', ...CORS_HEADERS };
+  function sendJSON(res, data, statusCode = 200, extraHeaders = null) {
+    res.writeHead(statusCode, extraHeaders ? { ...JSON_HEADERS, ...extraHeaders } : JSON_HEADERS);
     res.end(JSON.stringify(data));
   }
 
+  // Helper: JSON-RPC success whose result is already serialised — only the
+  // request id is encoded per call (id omitted when absent, as JSON.stringify would)
+  function sendPreserializedResult(res, id, resultJson) {
+    res.writeHead(200, JSON_HEADERS);
+    const idField = id === undefined ? '' : `,"id":${JSON.stringify(id)}`;
+    res.end(`{"jsonrpc":"2.0"${idField},"result":${resultJson}}`);
+  }
+
+  // Tools that MUST be handled locally (not available on backend).
+  // Built once — not re-allocated on every tool call.
+  const localOnlyHandlers = {
+    'get_user_context': handleGetUserContext,
+    'run_workflow': handleRunWorkflow,
+    'list_workflows': handleListWorkflows,
+    'save_conversation': handleSaveConversation, // local for tag preservation + validation parity
+    'save_artifact': handleSaveArtifact,
+    'share_memory': handleShareMemory,
+    'recall_public': handleRecallPublic,
+    'get_public_memory': handleGetPublicMemory,
+    'report_memory': handleReportMemory,
+    'generate_handoff_brief': handleGenerateHandoffBrief,
+  };
+
+  // batch_execute: each operation goes through executeToolForRemote, so
+  // local/proxied routing, token refresh and usage counts all apply. Proxy
+  // failures come back as { error }; they are surfaced as error results.
+  function executeBatchForRemote(toolArgs, apiKey) {
+    return executeBatch(toolArgs, async (name, opArgs) => {
+      const result = await executeToolForRemote(name, opArgs, apiKey);
+      return result?.error ? { isError: true, content: [{ type: 'text', text: result.error }] } : result;
+    });
+  }
+
   // Helper: execute a tool call (proxies to backend or handles locally)
   async function executeToolForRemote(toolName, toolArgs, apiKey) {
+    if (toolName === 'batch_execute') return executeBatchForRemote(toolArgs, apiKey);
+
     // Track tool usage
     toolCallCounts[toolName] = (toolCallCounts[toolName] || 0) + 1;
 
-    // Tools that MUST be handled locally (not available on backend)
-    const localOnlyHandlers = {
-      'get_user_context': handleGetUserContext,
-      'run_workflow': handleRunWorkflow,
-      'list_workflows': handleListWorkflows,
-      'save_conversation': handleSaveConversation, // local for tag preservation + validation parity
-      'save_artifact': handleSaveArtifact,
-      'share_memory': handleShareMemory,
-      'recall_public': handleRecallPublic,
-      'get_public_memory': handleGetPublicMemory,
-      'report_memory': handleReportMemory,
-      'generate_handoff_brief': handleGenerateHandoffBrief,
-    };
-
-    const localHandler = localOnlyHandlers[toolName];
+    const localHandler = Object.hasOwn(localOnlyHandlers, toolName) ? localOnlyHandlers[toolName] : undefined;
     if (localHandler) {
       // Use per-request API key for the handler call (concurrency-safe)
       const effectiveKey = apiKey || resolvedApiKey;
       try { return await localHandler(toolArgs, effectiveKey); }
-      catch (e) { return { content: [{ type: 'text', text: `Error: ${e.message}` }] }; }
+      catch (e) { return { isError: true, content: [{ type: 'text', text: `Error: ${e.message}` }] }; }
     }
 
     // recall_memories, get_memory_details, discover_related_conversations
     // proxy to backend — ChatGPT widgets parse the backend's response format
     try {
-      const resp = await fetch(`${API_URL}/api/v10/mcp/tools/execute`, {
+      const payload = JSON.stringify({ tool: toolName, arguments: toolArgs });
+      const resp = await fetch(TOOLS_EXECUTE_URL, {
         method: 'POST',
         headers: {
           'Authorization': `Bearer ${apiKey}`,
           'Content-Type': 'application/json',
-          'User-Agent': `purmemo-mcp/${CLIENT_VERSION}`,
+          'User-Agent': USER_AGENT,
           'X-MCP-Version': CLIENT_VERSION
         },
-        body: JSON.stringify({ tool: toolName, arguments: toolArgs }),
+        body: payload,
         signal: AbortSignal.timeout(30000)
       });
 
+      // Success is the common case — settle it with one check before any of
+      // the error-specific branches below
+      if (resp.ok) return await resp.json();
+
       if (resp.status === 401) {
+        releaseBody(resp);
+        const cacheKey = tokenCacheKey(apiKey);
+        validatedTokens.delete(cacheKey);
         // Silent token refresh — try refreshing before telling user to reconnect
-        if (refreshTokenStore[apiKey]?.token) {
+        const newToken = await refreshAccessToken(cacheKey);
+        if (newToken) {
           try {
-            const refreshResp = await fetch(`${API_URL}/api/v1/auth/refresh`, {
+            // Retry the tool call with new token
+            const retryResp = await fetch(TOOLS_EXECUTE_URL, {
               method: 'POST',
-              headers: { 'Content-Type': 'application/json' },
-              body: JSON.stringify({ refresh_token: refreshTokenStore[apiKey].token }),
-              signal: AbortSignal.timeout(10000)
+              headers: {
+                'Authorization': `Bearer ${newToken}`,
+                'Content-Type': 'application/json',
+                'User-Agent': USER_AGENT
+              },
+              body: payload,
+              signal: AbortSignal.timeout(30000)
             });
-            if (refreshResp.ok) {
-              const refreshData = await refreshResp.json();
-              const newToken = refreshData.access_token || refreshData.api_key;
-              if (newToken) {
-                if (refreshData.refresh_token) refreshTokenStore[newToken] = { token: refreshData.refresh_token, createdAt: Date.now() };
-                delete refreshTokenStore[apiKey];
-                // Retry the tool call with new token
-                const retryResp = await fetch(`${API_URL}/api/v10/mcp/tools/execute`, {
-                  method: 'POST',
-                  headers: {
-                    'Authorization': `Bearer ${newToken}`,
-                    'Content-Type': 'application/json',
-                    'User-Agent': `purmemo-mcp/${CLIENT_VERSION}`
-                  },
-                  body: JSON.stringify({ tool: toolName, arguments: toolArgs }),
-                  signal: AbortSignal.timeout(30000)
-                });
-                if (retryResp.ok) {
-                  structuredLog.info('Silent token refresh succeeded', { tool: toolName });
-                  return await retryResp.json();
-                }
-              }
+            if (retryResp.ok) {
+              structuredLog.info('Silent token refresh succeeded', { tool: toolName });
+              return await retryResp.json();
             }
+            releaseBody(retryResp);
           } catch (e) {
-            structuredLog.warn('Silent token refresh failed', { error: e.message });
+            structuredLog.warn('Retry after token refresh failed', { error: e.message });
           }
         }
         return {
@@ -347,19 +543,14 @@ export async function startRemoteServer(ctx) {
         }
       }
 
-      if (!resp.ok) {
-        const errText = await resp.text();
-        recentErrors.push({ timestamp: new Date().toISOString(), tool: toolName, status: resp.status, error: errText.substring(0, 200) });
-        if (recentErrors.length > 100) recentErrors.shift();
-        return { error: `API error ${resp.status}: ${errText.substring(0, 200)}` };
-      }
-
-      const data = await resp.json();
-      return data;
+      const errText = await resp.text();
+      recentErrors.push({ at: Date.now(), tool: toolName, status: resp.status, error: errText.substring(0, 200) });
+      return { error: `API error ${resp.status}: ${errText.substring(0, 200)}` };
     } catch (e) {
-      recentErrors.push({ timestamp: new Date().toISOString(), tool: toolName, error: e.message });
-      if (recentErrors.length > 100) recentErrors.shift();
-      return { error: e.name === 'AbortError' ? 'Request timeout' : e.message };
+      recentErrors.push({ at: Date.now(), tool: toolName, status: null, error: e.message });
+      // AbortSignal.timeout() rejects with a TimeoutError, not an AbortError
+      const timedOut = e.name === 'TimeoutError' || e.name === 'AbortError';
+      return { error: timedOut ? 'Request timeout' : e.message };
     }
   }
 
@@ -388,7 +579,8 @@ export async function startRemoteServer(ctx) {
           });
         }
         const sessionId = randomUUID();
-        mcpSessions.set(sessionId, { token: apiKey, createdAt: Date.now(), lastActivity: Date.now() });
+        const now = Date.now();
+        mcpSessions.set(sessionId, { token: apiKey, createdAt: now, lastActivity: now });
         connectionCount++;
         connMonitor.trackConnection(sessionId, { type: 'streamable-http' });
 
@@ -399,8 +591,8 @@ export async function startRemoteServer(ctx) {
           jsonrpc: '2.0', id: requestId,
           result: {
             protocolVersion: negotiatedVersion,
-            capabilities: { tools: { listChanged: true }, resources: { subscribe: false, listChanged: false }, prompts: { listChanged: false }, logging: {} },
-            serverInfo: { name: 'purmemo-mcp', version: CLIENT_VERSION },
+            capabilities: SERVER_CAPABILITIES,
+            serverInfo: SERVER_INFO,
             instructions: 'pūrmemo tools are ready. Save memories, recall information, and run memory-powered workflows.'
           }
         }, 200, { 'Mcp-Session-Id': sessionId });
@@ -418,15 +610,22 @@ export async function startRemoteServer(ctx) {
 
       // ── tools/list (PUBLIC — no auth required) ──
       if (method === 'tools/list') {
-        return sendJSON(res, { jsonrpc: '2.0', id: requestId, result: { tools: TOOLS } });
+        return sendPreserializedResult(res, requestId, TOOLS_LIST_JSON);
       }
 
       // ── Auth required for remaining methods ──
       const sessionId = req.headers['mcp-session-id'] || req.headers['Mcp-Session-Id'];
       let apiKey = null;
-      if (sessionId && mcpSessions.has(sessionId)) {
-        apiKey = mcpSessions.get(sessionId).token;
-        mcpSessions.get(sessionId).lastActivity = Date.now();
+      const session = sessionId ? mcpSessions.get(sessionId) : undefined;
+      if (session) {
+        apiKey = session.token;
+        // Re-insert so the Map stays ordered by lastActivity (see cleanup)
+        const now = Date.now();
+        if (now - session.lastActivity >= SESSION_TOUCH_INTERVAL_MS) {
+          session.lastActivity = now;
+          mcpSessions.delete(sessionId);
+          mcpSessions.set(sessionId, session);
+        }
       } else {
         apiKey = await validateApiKeyFromRequest(req);
       }
@@ -440,10 +639,7 @@ export async function startRemoteServer(ctx) {
 
       // ── resources/list ──
       if (method === 'resources/list') {
-        return sendJSON(res, {
-          jsonrpc: '2.0', id: requestId,
-          result: { resources: RESOURCES, resourceTemplates: RESOURCE_TEMPLATES }
-        });
+        return sendPreserializedResult(res, requestId, RESOURCES_LIST_JSON);
       }
 
       // ── resources/read ──
@@ -459,10 +655,7 @@ export async function startRemoteServer(ctx) {
           'ui://widgets/discover.html': 'discover.html'
         };
         if (widgetFiles[uri]) {
-          const { readFileSync: rfs } = await import('node:fs');
-          const { dirname: dn, join: jn } = await import('node:path');
-          const { fileURLToPath: fu } = await import('node:url');
-          const html = rfs(jn(dn(fu(import.meta.url)), 'widgets', widgetFiles[uri]), 'utf8');
+          const html = readAsset(join('widgets', widgetFiles[uri]));
           return sendJSON(res, {
             jsonrpc: '2.0', id: requestId,
             result: { contents: [{ uri, mimeType: 'text/html+skybridge', text: html }] }
@@ -471,20 +664,20 @@ export async function startRemoteServer(ctx) {
 
         // Memory resources — proxy to backend
         try {
-          const authHeaders = { 'Authorization': `Bearer ${apiKey}`, 'User-Agent': `purmemo-mcp/${CLIENT_VERSION}` };
+          const authHeaders = { 'Authorization': `Bearer ${apiKey}`, 'User-Agent': USER_AGENT };
           let text = '', mimeType = 'text/plain';
 
           if (uri === 'memory://me') {
             const [meResp, statsResp, memsResp, sessResp] = await Promise.allSettled([
-              fetch(`${API_URL}/api/v1/auth/me`, { headers: authHeaders, signal: AbortSignal.timeout(10000) }),
+              fetch(AUTH_ME_URL, { headers: authHeaders, signal: AbortSignal.timeout(10000) }),
               fetch(`${API_URL}/api/v1/stats/`, { headers: authHeaders, signal: AbortSignal.timeout(10000) }),
               fetch(`${API_URL}/api/v1/memories/?limit=20&sort=created_at&order=desc`, { headers: authHeaders, signal: AbortSignal.timeout(10000) }),
               fetch(`${API_URL}/api/v1/identity/session`, { headers: authHeaders, signal: AbortSignal.timeout(10000) })
             ]);
-            const me = meResp.status === 'fulfilled' && meResp.value.ok ? await meResp.value.json() : {};
-            const stats = statsResp.status === 'fulfilled' && statsResp.value.ok ? await statsResp.value.json() : {};
-            const mems = memsResp.status === 'fulfilled' && memsResp.value.ok ? await memsResp.value.json() : [];
-            const sess = sessResp.status === 'fulfilled' && sessResp.value.ok ? await sessResp.value.json() : {};
+            const me = meResp.status === 'fulfilled' ? await jsonOrDrain(meResp.value, {}) : {};
+            const stats = statsResp.status === 'fulfilled' ? await jsonOrDrain(statsResp.value, {}) : {};
+            const mems = memsResp.status === 'fulfilled' ? await jsonOrDrain(memsResp.value, []) : [];
+            const sess = sessResp.status === 'fulfilled' ? await jsonOrDrain(sessResp.value, {}) : {};
             const identity = me.identity || {};
             const session = sess.session || {};
             const name = me.full_name || (me.email || '').split('@')[0] || 'User';
@@ -515,27 +708,34 @@ export async function startRemoteServer(ctx) {
             try {
               if (uri === 'memory://context') {
                 const data = await fetch(`${API_URL}/api/v1/memories/?limit=5&sort=created_at&order=desc`, { headers: authHeaders, signal: AbortSignal.timeout(10000) });
-                const mems = data.ok ? await data.json() : [];
+                const mems = await jsonOrDrain(data, []);
                 const memList = Array.isArray(mems) ? mems : (mems.memories || []);
                 text = memList.map((m, i) => `${i + 1}. **${m.title || 'Untitled'}** (${new Date(m.created_at).toLocaleDateString()})\n   ${(m.content || '').substring(0, 150)}...`).join('\n\n');
               } else if (uri === 'memory://projects') {
                 const data = await fetch(`${API_URL}/api/v1/memories/?limit=20&sort=created_at&order=desc`, { headers: authHeaders, signal: AbortSignal.timeout(10000) });
-                const mems = data.ok ? await data.json() : [];
+                const mems = await jsonOrDrain(data, []);
                 const memList = Array.isArray(mems) ? mems : (mems.memories || []);
                 const byProj = {};
                 for (const m of memList) { const p = m.project_name || 'Other'; (byProj[p] = byProj[p] || []).push(m.title || 'Untitled'); }
                 text = Object.entries(byProj).map(([p, titles]) => `## ${p}\n${titles.slice(0, 3).map(t => `- ${t}`).join('\n')}`).join('\n\n');
               } else {
                 const data = await fetch(`${API_URL}/api/v1/stats/`, { headers: authHeaders, signal: AbortSignal.timeout(10000) });
-                const stats = data.ok ? await data.json() : {};
+                const stats = await jsonOrDrain(data, {});
                 text = `## Memory Vault Stats\n\n**Total:** ${stats.total_memories || 0}\n**This week:** ${stats.memories_this_week || 0}\n**Platforms:** ${(stats.platforms || []).join(', ')}`;
               }
             } catch (e) { text = `Error loading ${uri}: ${e.message}`; }
           } else if (uri.startsWith('memory://')) {
             const memId = uri.replace('memory://', '');
             try {
-              const data = await fetch(`${API_URL}/api/v1/memories/${memId}/`, { headers: authHeaders, signal: AbortSignal.timeout(10000) });
-              text = data.ok ? JSON.stringify(await data.json(), null, 2) : `Memory not found: ${memId}`;
+              const data = await fetch(`${API_URL}/api/v1/memories/${encodeURIComponent(memId)}/`, { headers: authHeaders, signal: AbortSignal.timeout(10000) });
+              // Relay the backend's JSON as-is — parsing it only to re-indent
+              // it inflated every read for a machine-consumed payload
+              if (data.ok) {
+                text = await data.text();
+              } else {
+                releaseBody(data);
+                text = `Memory not found: ${memId}`;
+              }
               mimeType = 'application/json';
             } catch (e) { text = `Error: ${e.message}`; }
           } else {
@@ -553,7 +753,7 @@ export async function startRemoteServer(ctx) {
 
       // ── prompts/list ──
       if (method === 'prompts/list') {
-        return sendJSON(res, { jsonrpc: '2.0', id: requestId, result: { prompts: PROMPTS } });
+        return sendPreserializedResult(res, requestId, PROMPTS_LIST_JSON);
       }
 
       // ── prompts/get ──
@@ -602,7 +802,8 @@ export async function startRemoteServer(ctx) {
         }
 
         // Normal result — wrap in content if needed
-        const content = result?.content || [{ type: 'text', text: JSON.stringify(result?.data || result, null, 2) }];
+        // Compact JSON: clients parse or tokenise this, indentation is just bytes
+        const content = result?.content || [{ type: 'text', text: JSON.stringify(result?.data || result) }];
         return sendSSE(res, { jsonrpc: '2.0', id: requestId, result: { content } });
       }
 
@@ -627,7 +828,8 @@ export async function startRemoteServer(ctx) {
 
     const sessionId = req.headers['mcp-session-id'] || randomUUID();
     if (!mcpSessions.has(sessionId)) {
-      mcpSessions.set(sessionId, { token: apiKey, createdAt: Date.now(), lastActivity: Date.now() });
+      const now = Date.now();
+      mcpSessions.set(sessionId, { token: apiKey, createdAt: now, lastActivity: now });
     }
 
     res.writeHead(200, {
@@ -665,14 +867,14 @@ export async function startRemoteServer(ctx) {
 
   // ── /mcp — direct handlers (NOT aliases — ChatGPT validates this URL) ──
   app.options('/mcp', (req, res) => { res.writeHead(204, CORS_HEADERS); res.end(); });
-  app.post('/mcp', async (req, res) => {
+  app.post('/mcp', (req, res) => {
     // Same handler as /mcp/messages — ChatGPT uses this URL
     req.url = '/mcp/messages';
     return app._router.handle(req, res, () => res.status(404).end());
   });
 
   // ── /mcp/sse — legacy SSE endpoint (Python had this) ──
-  app.get('/mcp/sse', async (req, res) => {
+  app.get('/mcp/sse', (req, res) => {
     // Forward to /sse handler
     req.url = '/sse';
     return app._router.handle(req, res, () => res.status(404).end());
@@ -708,19 +910,36 @@ export async function startRemoteServer(ctx) {
   });
 
   // ── MCP well-known endpoints (for OAuth discovery) ──
+  // Every client connect fetches these, and their content depends only on the
+  // Host header — so each document is serialised once per host and the string
+  // re-sent, rather than rebuilt and run through res.json() per request.
+  // Host is client-supplied; the cache is cleared if it ever grows past a
+  // handful of names.
+  const WELL_KNOWN_HOSTS_MAX = 32;
+  function sendHostDocument(req, res, cache, build) {
+    const host = req.get('host');
+    let body = cache.get(host);
+    if (body === undefined) {
+      body = JSON.stringify(build(`https://${host}`));
+      if (cache.size >= WELL_KNOWN_HOSTS_MAX) cache.clear();
+      cache.set(host, body);
+    }
+    res.type('application/json').send(body);
+  }
+
+  const protectedResourceDocs = new Map();
   app.get('/.well-known/oauth-protected-resource', (req, res) => {
-    const serverUrl = `https://${req.get('host')}`;
-    res.json({
+    sendHostDocument(req, res, protectedResourceDocs, (serverUrl) => ({
       resource: serverUrl,
       authorization_servers: [serverUrl],
       bearer_methods_supported: ['header'],
       scopes_supported: ['read', 'write']
-    });
+    }));
   });
 
+  const authorizationServerDocs = new Map();
   app.get('/.well-known/oauth-authorization-server', (req, res) => {
-    const serverUrl = `https://${req.get('host')}`;
-    res.json({
+    sendHostDocument(req, res, authorizationServerDocs, (serverUrl) => ({
       issuer: serverUrl,
       authorization_endpoint: `${serverUrl}/oauth/authorize`,
       token_endpoint: `${serverUrl}/oauth/token`,
@@ -730,12 +949,12 @@ export async function startRemoteServer(ctx) {
       code_challenge_methods_supported: ['S256', 'plain'],
       token_endpoint_auth_methods_supported: ['client_secret_post', 'none'],
       scopes_supported: ['read', 'write']
-    });
+    }));
   });
 
+  const mcpDiscoveryDocs = new Map();
   app.get('/.well-known/mcp', (req, res) => {
-    const serverUrl = `https://${req.get('host')}`;
-    res.json({
+    sendHostDocument(req, res, mcpDiscoveryDocs, (serverUrl) => ({
       mcp_version: '2025-06-18',
       server_name: 'pūrmemo MCP Server',
       server_version: CLIENT_VERSION,
@@ -751,7 +970,7 @@ export async function startRemoteServer(ctx) {
         pkce_required: true
       },
       capabilities: { tools: true, resources: true, prompts: true }
-    });
+    }));
   });
 
   app.get('/.well-known/mcp.json', (req, res) => {
@@ -759,9 +978,13 @@ export async function startRemoteServer(ctx) {
     app.handle(req, res);
   });
 
+  // TOOLS is fixed at startup — summarise it once instead of splitting every
+  // tool description on each manifest request
+  const MANIFEST_TOOLS = TOOLS.map(t => ({ name: t.name, description: t.description.split('\n')[0] }));
+
+  const manifestDocs = new Map();
   app.get('/.well-known/mcp-manifest.json', (req, res) => {
-    const serverUrl = `https://${req.get('host')}`;
-    res.json({
+    sendHostDocument(req, res, manifestDocs, (serverUrl) => ({
       name: 'purmemo',
       version: CLIENT_VERSION,
       description: 'AI-powered memory and knowledge management platform — save and recall conversations across Claude, ChatGPT, Gemini, and more',
@@ -785,24 +1008,24 @@ export async function startRemoteServer(ctx) {
         sse: '/sse',
         health: '/health'
       },
-      tools: TOOLS.map(t => ({ name: t.name, description: t.description.split('\n')[0] })),
+      tools: MANIFEST_TOOLS,
       contact: { email: 'support@purmemo.ai', documentation: 'https://docs.purmemo.ai/mcp' }
-    });
+    }));
   });
 
   // ── OAuth Module ──
   const { generateCode, storeAuthCode, exchangeCodeForToken } = await import('./oauth-simple.js');
-  const { readFileSync } = await import('node:fs');
-  const { dirname, join } = await import('node:path');
-  const { fileURLToPath: furl } = await import('node:url');
-  const __remoteDir = dirname(furl(import.meta.url));
 
   // In-memory stores for OAuth state and refresh tokens
   // Both have TTL cleanup to prevent unbounded memory growth
   const oauthStateStorage: Record<string, { params: string; provider: string; createdAt: number }> = {};
+  // Refresh tokens are keyed by tokenCacheKey(access token), not the access
+  // token itself — a fixed 44-char key instead of a long bearer string, and a
+  // dump of the keys yields nothing usable
   const refreshTokenStore: Record<string, { token: string; createdAt: number }> = {};
 
-  // Clean up abandoned OAuth states (>10 min) and expired refresh tokens (>24 hr)
+  // Clean up abandoned OAuth states (>10 min), expired refresh tokens (>24 hr)
+  // and idle per-IP rate-limit buckets
   setInterval(() => {
     const now = Date.now();
     for (const key of Object.keys(oauthStateStorage)) {
@@ -811,20 +1034,51 @@ export async function startRemoteServer(ctx) {
     for (const key of Object.keys(refreshTokenStore)) {
       if (now - refreshTokenStore[key].createdAt > 86_400_000) delete refreshTokenStore[key];
     }
+    // Drop rate-limit buckets whose window has closed
+    for (const key of Object.keys(rateLimits)) {
+      if (rateLimits[key].resetAt <= now) delete rateLimits[key];
+    }
   }, 300_000); // every 5 minutes
 
-  // Rate limiter (per-IP, leaky bucket)
+  // Rate limiter (per-IP, fixed window). One counter per bucket, started on
+  // the first hit and reset when its window closes — a single check-and-
+  // increment per request instead of keeping and trimming a timestamp per hit.
   const rateLimits = {};
   function checkRateLimit(ip, endpoint, limit, windowSec = 60) {
     const key = `${ip}:${endpoint}`;
     const now = Date.now();
-    const windowMs = windowSec * 1000;
-    const timestamps = (rateLimits[key] || []).filter(t => t > now - windowMs);
-    if (timestamps.length >= limit) return false;
-    timestamps.push(now);
-    rateLimits[key] = timestamps;
+    let bucket = rateLimits[key];
+    if (!bucket || bucket.resetAt <= now) {
+      bucket = rateLimits[key] = { count: 0, resetAt: now + windowSec * 1000 };
+    }
+    if (bucket.count >= limit) return false;
+    bucket.count++;
     return true;
   }
+  // Credential shape checks, compiled once. Malformed submissions are turned
+  // away here instead of costing a backend round trip; the backend remains
+  // the authority on everything else. MIN_PASSWORD_LENGTH matches login.html.
+  const EMAIL_RE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+  const MIN_PASSWORD_LENGTH = 8;
+  function isValidEmail(email) {
+    return typeof email === 'string' && email.length <= 254 && EMAIL_RE.test(email);
+  }
+  // Concurrent in-flight /login and /register calls per email. The rate
+  // limiter bounds frequency only; a burst of simultaneous submissions for one
+  // account would each hold a backend password-hash check at the same time.
+  const MAX_CONCURRENT_AUTH = 3;
+  const authInFlight = new Map();
+  function acquireAuthSlot(key) {
+    const n = authInFlight.get(key) || 0;
+    if (n >= MAX_CONCURRENT_AUTH) return false;
+    authInFlight.set(key, n + 1);
+    return true;
+  }
+  function releaseAuthSlot(key) {
+    const n = authInFlight.get(key) - 1;
+    if (n > 0) authInFlight.set(key, n);
+    else authInFlight.delete(key);
+  }
   function getClientIp(req) {
     return req.headers['x-forwarded-for']?.split(',')[0]?.trim() || req.socket?.remoteAddress || 'unknown';
   }
@@ -848,7 +1102,9 @@ export async function startRemoteServer(ctx) {
       return res.status(429).json({ error: 'Too many registration requests. Retry after 60 seconds.' });
     }
     const body = req.body || {};
-    const clientId = `claude-${randomUUID().substring(0, 8)}`;
+    // 8 hex chars straight from 4 random bytes — same shape as the first
+    // UUID group, without formatting a whole UUID string only to slice it
+    const clientId = `claude-${randomBytes(4).toString('hex')}`;
     res.json({
       client_id: clientId,
       client_name: body.client_name || 'Claude Desktop',
@@ -862,6 +1118,41 @@ export async function startRemoteServer(ctx) {
     });
   });
 
+  // Client redirect carrying the authorization code. Values are bound as
+  // encoded query parameters — never spliced in raw, where a state containing
+  // '&' or '#' could inject or truncate parameters.
+  function authCallbackUrl(redirectUri, code, state) {
+    let url = redirectUri + (redirectUri.includes('?') ? '&' : '?') + `code=${encodeURIComponent(code)}`;
+    if (state) url += `&state=${encodeURIComponent(state)}`;
+    return url;
+  }
+
+  // Issue an MCP authorization code for a validated key and return the
+  // success page, which bounces the browser back to the client's redirect_uri
+  function sendAuthorizationSuccess(res, apiKey, { client_id, redirect_uri, code_challenge,
+                                                    code_challenge_method = 'S256', scope, state }) {
+    const code = generateCode();
+    storeAuthCode({ code, apiKey, clientId: client_id, redirectUri: redirect_uri,
+      codeChallenge: code_challenge, codeChallengeMethod: code_challenge_method, scope, state });
+
+    const callbackUrl = authCallbackUrl(redirect_uri, code, state);
+
+    return res.type('html').send(renderTemplate('success.html', { REDIRECT_URL: callbackUrl }));
+  }
+
+  // After /login or /register: the key was just issued by the backend, so
+  // complete the authorization in this response. Bouncing the browser through
+  // /oauth/authorize?session= cost a redirect plus an /auth/me revalidation.
+  function completeLogin(res, apiKey, params) {
+    if (params) {
+      const oauthParams = JSON.parse(Buffer.from(params, 'base64url').toString());
+      if (oauthParams.client_id && oauthParams.redirect_uri && oauthParams.code_challenge) {
+        return sendAuthorizationSuccess(res, apiKey, oauthParams);
+      }
+    }
+    res.redirect(`/oauth/authorize?session=${Buffer.from(apiKey).toString('base64')}`);
+  }
+
   // ── OAuth: Authorization Endpoint ──
   app.get('/oauth/authorize', async (req, res) => {
     if (!checkRateLimit(getClientIp(req), 'authorize', 10)) {
@@ -878,23 +1169,22 @@ export async function startRemoteServer(ctx) {
     if (session) {
       try {
         const apiKey = Buffer.from(session, 'base64').toString('utf8');
-        // Validate against backend
-        const meResp = await fetch(`${API_URL}/api/v1/auth/me`, {
-          headers: { 'Authorization': `Bearer ${apiKey}`, 'User-Agent': `purmemo-mcp/${CLIENT_VERSION}` },
-          signal: AbortSignal.timeout(10000)
-        });
-        if (meResp.ok) {
-          const code = generateCode();
-          storeAuthCode({ code, apiKey, clientId: client_id, redirectUri: redirect_uri,
-            codeChallenge: code_challenge, codeChallengeMethod: code_challenge_method, scope, state });
-
-          let callbackUrl = redirect_uri + (redirect_uri.includes('?') ? '&' : '?') + `code=${code}`;
-          if (state) callbackUrl += `&state=${state}`;
-
-          // Return success page
-          let successHtml = readFileSync(join(__remoteDir, 'success.html'), 'utf8');
-          successHtml = successHtml.replace('<!-- REDIRECT_URL -->', callbackUrl);
-          return res.type('html').send(successHtml);
+        const cacheKey = tokenCacheKey(apiKey);
+        // Validate against backend, unless it accepted this key moments ago
+        // (the session usually comes straight from /login or /register)
+        let valid = isRecentlyValidated(cacheKey);
+        if (!valid) {
+          const meResp = await fetch(AUTH_ME_URL, {
+            headers: { 'Authorization': `Bearer ${apiKey}`, 'User-Agent': USER_AGENT },
+            signal: AbortSignal.timeout(10000)
+          });
+          releaseBody(meResp);
+          valid = meResp.ok;
+          if (valid) rememberValidated(cacheKey);
+        }
+        if (valid) {
+          return sendAuthorizationSuccess(res, apiKey,
+            { client_id, redirect_uri, code_challenge, code_challenge_method, scope, state });
         }
       } catch (e) {
         structuredLog.error('OAuth authorize session error', { error: e.message });
@@ -912,15 +1202,13 @@ export async function startRemoteServer(ctx) {
   app.get('/login', (req, res) => {
     const params = req.query.params || '';
     const signupComplete = req.query.signup_complete;
-    let html = readFileSync(join(__remoteDir, 'login.html'), 'utf8');
     // Inject params into template
-    html = html.replace(/<!-- PARAMS -->/g, params);
-    if (signupComplete) {
-      html = html.replace('<!-- SIGNUP_BANNER -->',
-        '<div class="success-banner">Account created — sign in below to continue.</div>');
-    } else {
-      html = html.replace('<!-- SIGNUP_BANNER -->', '');
-    }
+    const html = renderTemplate('login.html', {
+      PARAMS: params,
+      SIGNUP_BANNER: signupComplete
+        ? '<div class="success-banner">Account created — sign in below to continue.</div>'
+        : ''
+    });
     res.type('html').send(html);
   });
 
@@ -930,14 +1218,22 @@ export async function startRemoteServer(ctx) {
       return res.status(429).send('Too many login attempts. Please wait a moment.');
     }
     const { email, password, params } = req.body;
+    if (!isValidEmail(email) || typeof password !== 'string' || !password) {
+      return res.redirect(params ? `/login?params=${params}&error=invalid_credentials` : '/login?error=invalid_credentials');
+    }
+    const slotKey = email.toLowerCase();
+    if (!acquireAuthSlot(slotKey)) {
+      return res.status(429).send('Too many login attempts. Please wait a moment.');
+    }
     try {
       const authResp = await fetch(`${API_URL}/api/v1/auth/login`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json', 'User-Agent': `purmemo-mcp/${CLIENT_VERSION}` },
+        headers: JSON_POST_HEADERS,
         body: JSON.stringify({ email, password }),
         signal: AbortSignal.timeout(10000)
       });
       if (!authResp.ok) {
+        releaseBody(authResp);
         const errParam = authResp.status === 429 ? 'rate_limit' : 'invalid_credentials';
         const loginUrl = params ? `/login?params=${params}&error=${errParam}` : `/login?error=${errParam}`;
         return res.redirect(loginUrl);
@@ -946,24 +1242,17 @@ export async function startRemoteServer(ctx) {
       const apiKey = authData.api_key || authData.access_token;
       if (!apiKey) return res.status(500).send('No API key returned');
 
-      if (authData.refresh_token) refreshTokenStore[apiKey] = { token: authData.refresh_token, createdAt: Date.now() };
-      const sessionParam = Buffer.from(apiKey).toString('base64');
-
-      if (params) {
-        const oauthParams = JSON.parse(Buffer.from(params, 'base64url').toString());
-        let authorizeUrl = `/oauth/authorize?client_id=${oauthParams.client_id}`;
-        authorizeUrl += `&redirect_uri=${encodeURIComponent(oauthParams.redirect_uri)}`;
-        authorizeUrl += `&response_type=code&code_challenge=${oauthParams.code_challenge}`;
-        authorizeUrl += `&code_challenge_method=${oauthParams.code_challenge_method || 'S256'}`;
-        if (oauthParams.scope) authorizeUrl += `&scope=${oauthParams.scope}`;
-        if (oauthParams.state) authorizeUrl += `&state=${oauthParams.state}`;
-        authorizeUrl += `&session=${sessionParam}`;
-        return res.redirect(authorizeUrl);
-      }
-      res.redirect(`/oauth/authorize?session=${sessionParam}`);
+      const cacheKey = tokenCacheKey(apiKey);
+      if (authData.refresh_token) refreshTokenStore[cacheKey] = { token: authData.refresh_token, createdAt: Date.now() };
+      // Freshly issued by the backend — the OAuth hops and the client's first
+      // MCP requests that follow needn't re-check it with /auth/me
+      rememberValidated(cacheKey);
+      completeLogin(res, apiKey, params);
     } catch (e) {
       structuredLog.error('Login error', { error: e.message });
       res.status(500).send('Login failed');
+    } finally {
+      releaseAuthSlot(slotKey);
     }
   });
 
@@ -973,87 +1262,129 @@ export async function startRemoteServer(ctx) {
       return res.status(429).send('Too many registration attempts. Please wait a moment.');
     }
     const { email, password, params } = req.body;
+    if (!isValidEmail(email) || typeof password !== 'string' || password.length < MIN_PASSWORD_LENGTH) {
+      return res.redirect(params ? `/login?params=${params}&error=invalid_signup` : '/login?error=invalid_signup');
+    }
+    const slotKey = email.toLowerCase();
+    if (!acquireAuthSlot(slotKey)) {
+      return res.status(429).send('Too many registration attempts. Please wait a moment.');
+    }
     try {
       const regResp = await fetch(`${API_URL}/api/v1/auth/register`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json', 'User-Agent': `purmemo-mcp/${CLIENT_VERSION}` },
+        headers: JSON_POST_HEADERS,
         body: JSON.stringify({ email, password }),
         signal: AbortSignal.timeout(10000)
       });
       if (!regResp.ok) {
+        releaseBody(regResp);
         const loginUrl = params ? `/login?params=${params}` : '/login';
         return res.redirect(loginUrl);
       }
+      // The address exists now — drop any cached "not found" for it
+      checkEmailCache.delete(slotKey);
       const authData = await regResp.json();
       const apiKey = authData.api_key || authData.access_token;
       if (!apiKey) {
         const loginUrl = params ? `/login?params=${params}&signup_complete=1` : '/login?signup_complete=1';
         return res.redirect(loginUrl);
       }
-      if (authData.refresh_token) refreshTokenStore[apiKey] = { token: authData.refresh_token, createdAt: Date.now() };
-      const sessionParam = Buffer.from(apiKey).toString('base64');
-
-      if (params) {
-        const oauthParams = JSON.parse(Buffer.from(params, 'base64url').toString());
-        let authorizeUrl = `/oauth/authorize?client_id=${oauthParams.client_id}`;
-        authorizeUrl += `&redirect_uri=${encodeURIComponent(oauthParams.redirect_uri)}`;
-        authorizeUrl += `&response_type=code&code_challenge=${oauthParams.code_challenge}`;
-        authorizeUrl += `&code_challenge_method=${oauthParams.code_challenge_method || 'S256'}`;
-        if (oauthParams.scope) authorizeUrl += `&scope=${oauthParams.scope}`;
-        if (oauthParams.state) authorizeUrl += `&state=${oauthParams.state}`;
-        authorizeUrl += `&session=${sessionParam}`;
-        return res.redirect(authorizeUrl);
-      }
-      res.redirect(`/oauth/authorize?session=${sessionParam}`);
+      const cacheKey = tokenCacheKey(apiKey);
+      if (authData.refresh_token) refreshTokenStore[cacheKey] = { token: authData.refresh_token, createdAt: Date.now() };
+      // Freshly issued by the backend — the OAuth hops and the client's first
+      // MCP requests that follow needn't re-check it with /auth/me
+      rememberValidated(cacheKey);
+      completeLogin(res, apiKey, params);
     } catch (e) {
       structuredLog.error('Register error', { error: e.message });
       res.status(500).send('Registration failed');
+    } finally {
+      releaseAuthSlot(slotKey);
     }
   });
 
   // ── OAuth: Check Email (proxy to avoid CORS) ──
+  // Answers are remembered per address for a few seconds, hits and misses
+  // alike — caching only one kind would make cached responses a timing tell.
+  // Repeated probes (a user going back and forth on the login page, or an
+  // enumeration flood) are absorbed here instead of each costing a backend
+  // round trip. Accounts created through this server (/register, a first
+  // social login via /oauth/callback) evict their address; one created
+  // elsewhere, e.g. a web-app signup, can still read as missing until the
+  // entry expires, which is why the TTL is kept short.
+  const CHECK_EMAIL_TTL_MS = 10_000;
+  const CHECK_EMAIL_MAX = 1000;
+  const checkEmailCache = new Map();
+  function getCheckedEmail(key) {
+    const now = Date.now();
+    for (const [k, entry] of checkEmailCache) {
+      if (entry.expiresAt > now) break;
+      checkEmailCache.delete(k);
+    }
+    return checkEmailCache.get(key)?.body;
+  }
+  function rememberCheckedEmail(key, body) {
+    checkEmailCache.delete(key);
+    checkEmailCache.set(key, { body, expiresAt: Date.now() + CHECK_EMAIL_TTL_MS });
+    if (checkEmailCache.size > CHECK_EMAIL_MAX) {
+      checkEmailCache.delete(checkEmailCache.keys().next().value);
+    }
+  }
+
   app.post('/check-email', async (req, res) => {
     if (!checkRateLimit(getClientIp(req), 'check-email', 20)) {
       return res.status(429).json({ error: 'Too many requests. Please wait a moment.' });
     }
     try {
       const { email } = req.body;
+      if (!isValidEmail(email)) return res.json({ exists: false });
+      const key = email.toLowerCase();
+      const cached = getCheckedEmail(key);
+      if (cached !== undefined) return res.type('application/json').send(cached);
       const resp = await fetch(`${API_URL}/api/v1/auth/check-email`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json', 'User-Agent': `purmemo-mcp/${CLIENT_VERSION}` },
+        headers: JSON_POST_HEADERS,
         body: JSON.stringify({ email }),
         signal: AbortSignal.timeout(10000)
       });
-      if (resp.ok) return res.json(await resp.json());
+      // Relay the upstream JSON body as-is rather than parsing it into an
+      // object only for res.json() to serialise it straight back
+      if (resp.ok && resp.headers.get('content-type')?.includes('application/json')) {
+        const body = await resp.text();
+        rememberCheckedEmail(key, body);
+        return res.type('application/json').send(body);
+      }
+      releaseBody(resp);
       res.json({ exists: false });
     } catch { res.json({ exists: false }); }
   });
 
-  // ── OAuth: Google Login ──
-  app.get('/oauth/google/login', (req, res) => {
+  // ── OAuth: Social Login (Google / GitHub) ──
+  // The backend login URL is fixed apart from the state: its prefix up to and
+  // including the encoded return_url depends only on provider and Host, so it
+  // is built once per host and each request appends just the state.
+  const socialLoginPrefixes = new Map();
+  function redirectToSocialLogin(req, res, provider) {
     const params = req.query.params || '';
     const stateId = randomUUID();
     let statePayload = stateId;
     if (params) {
-      oauthStateStorage[stateId] = { params, provider: 'google', createdAt: Date.now() };
-      statePayload = Buffer.from(JSON.stringify({ id: stateId, params, provider: 'google' })).toString('base64url');
+      oauthStateStorage[stateId] = { params, provider, createdAt: Date.now() };
+      statePayload = Buffer.from(JSON.stringify({ id: stateId, params, provider })).toString('base64url');
     }
-    const callbackUrl = `https://${req.get('host')}/oauth/callback`;
-    res.redirect(`${API_URL}/api/v1/oauth/google/login?return_url=${callbackUrl}&state=${statePayload}`);
-  });
-
-  // ── OAuth: GitHub Login ──
-  app.get('/oauth/github/login', (req, res) => {
-    const params = req.query.params || '';
-    const stateId = randomUUID();
-    let statePayload = stateId;
-    if (params) {
-      oauthStateStorage[stateId] = { params, provider: 'github', createdAt: Date.now() };
-      statePayload = Buffer.from(JSON.stringify({ id: stateId, params, provider: 'github' })).toString('base64url');
+    const key = `${provider} ${req.get('host')}`;
+    let prefix = socialLoginPrefixes.get(key);
+    if (prefix === undefined) {
+      const callbackUrl = `https://${req.get('host')}/oauth/callback`;
+      prefix = `${API_URL}/api/v1/oauth/${provider}/login?return_url=${encodeURIComponent(callbackUrl)}&state=`;
+      if (socialLoginPrefixes.size >= WELL_KNOWN_HOSTS_MAX) socialLoginPrefixes.clear();
+      socialLoginPrefixes.set(key, prefix);
     }
-    const callbackUrl = `https://${req.get('host')}/oauth/callback`;
-    res.redirect(`${API_URL}/api/v1/oauth/github/login?return_url=${callbackUrl}&state=${statePayload}`);
-  });
+    res.redirect(prefix + encodeURIComponent(statePayload));
+  }
+
+  app.get('/oauth/google/login', (req, res) => redirectToSocialLogin(req, res, 'google'));
+  app.get('/oauth/github/login', (req, res) => redirectToSocialLogin(req, res, 'github'));
 
   // ── OAuth: Callback (from social login) ──
   app.get('/oauth/callback', async (req, res) => {
@@ -1082,14 +1413,23 @@ export async function startRemoteServer(ctx) {
       const decodedParams = JSON.parse(Buffer.from(mcpParams, 'base64').toString());
 
       // Validate token against backend
-      const meResp = await fetch(`${API_URL}/api/v1/auth/me`, {
-        headers: { 'Authorization': `Bearer ${token}` },
+      const meResp = await fetch(AUTH_ME_URL, {
+        headers: { 'Authorization': `Bearer ${token}`, 'User-Agent': USER_AGENT },
         signal: AbortSignal.timeout(10000)
       });
-      if (!meResp.ok) return res.status(401).send('Invalid token');
+      if (!meResp.ok) {
+        releaseBody(meResp);
+        return res.status(401).send('Invalid token');
+      }
+      // A first social login may have just created the account — drop any
+      // cached "no such account" answer for the address
+      const me = await meResp.json().catch(() => null);
+      if (typeof me?.email === 'string') checkEmailCache.delete(me.email.toLowerCase());
+      const cacheKey = tokenCacheKey(token);
+      rememberValidated(cacheKey);
 
       // Store refresh token
-      if (callbackRefreshToken) refreshTokenStore[token] = { token: callbackRefreshToken, createdAt: Date.now() };
+      if (callbackRefreshToken) refreshTokenStore[cacheKey] = { token: callbackRefreshToken, createdAt: Date.now() };
 
       // Generate MCP authorization code
       const authCode = generateCode();
@@ -1101,13 +1441,10 @@ export async function startRemoteServer(ctx) {
       });
 
       // Build redirect
-      let finalRedirect = decodedParams.redirect_uri + (decodedParams.redirect_uri.includes('?') ? '&' : '?') + `code=${authCode}`;
-      if (decodedParams.state) finalRedirect += `&state=${decodedParams.state}`;
+      const finalRedirect = authCallbackUrl(decodedParams.redirect_uri, authCode, decodedParams.state);
 
       // Return success page
-      let successHtml = readFileSync(join(__remoteDir, 'success.html'), 'utf8');
-      successHtml = successHtml.replace('<!-- REDIRECT_URL -->', finalRedirect);
-      res.type('html').send(successHtml);
+      res.type('html').send(renderTemplate('success.html', { REDIRECT_URL: finalRedirect }));
     } catch (e) {
       structuredLog.error('OAuth callback error', { error: e.message });
       res.status(500).send('OAuth callback failed');
@@ -1134,7 +1471,7 @@ export async function startRemoteServer(ctx) {
     }
 
     const [apiKey, storedRefreshToken] = result;
-    if (storedRefreshToken) refreshTokenStore[apiKey] = { token: storedRefreshToken, createdAt: Date.now() };
+    if (storedRefreshToken) refreshTokenStore[tokenCacheKey(apiKey)] = { token: storedRefreshToken, createdAt: Date.now() };
 
     res.json({
       access_token: apiKey,
@@ -1145,20 +1482,16 @@ export async function startRemoteServer(ctx) {
   });
 
   // ── Favicon / Icon ──
-  app.get('/favicon.ico', async (req, res) => {
+  app.get('/favicon.ico', (req, res) => {
     try {
-      const { readFileSync: rfs } = await import('node:fs');
-      const { dirname: dn, join: jn } = await import('node:path');
-      const { fileURLToPath: fu } = await import('node:url');
-      const iconPath = jn(dn(fu(import.meta.url)), 'icon.png');
-      const data = rfs(iconPath);
+      const data = readAsset('icon.png', null);
       res.setHeader('Content-Type', 'image/png');
       res.setHeader('Cache-Control', 'public, max-age=86400');
       res.send(data);
     } catch { res.status(404).end(); }
   });
 
-  app.get('/icon.png', async (req, res) => {
+  app.get('/icon.png', (req, res) => {
     req.url = '/favicon.ico';
     return app._router.handle(req, res, () => res.status(404).end());
   });
@@ -1181,13 +1514,19 @@ export async function startRemoteServer(ctx) {
 
   // Start
   const PORT = parseInt(process.env.PORT || '8000', 10);
+  const SHUTDOWN_TIMEOUT_MS = 5000;
+  // Keep idle client sockets open longer than the usual 60s load-balancer idle
+  // timeout. Node's 5s default makes the proxy's pooled connections race our
+  // close, so requests land on reset sockets and the proxy reconnects.
+  // headersTimeout must stay above keepAliveTimeout.
+  const KEEP_ALIVE_TIMEOUT_MS = 65_000;
 
   resolveApiKey().then(apiKey => {
     resolvedApiKey = apiKey;
     setResolvedApiKey(apiKey);
     checkForUpdates();
 
-    app.listen(PORT, () => {
+    const httpServer = app.listen(PORT, () => {
       structuredLog.info('Purmemo Remote MCP Server started', {
         mode: 'remote',
         version: CLIENT_VERSION,
@@ -1204,6 +1543,8 @@ export async function startRemoteServer(ctx) {
         }
       });
     });
+    httpServer.keepAliveTimeout = KEEP_ALIVE_TIMEOUT_MS;
+    httpServer.headersTimeout = KEEP_ALIVE_TIMEOUT_MS + 1000;
   }).catch(error => {
     structuredLog.error('Failed to start remote MCP server', { error_message: error.message });
     process.exit(1);
@@ -1214,10 +1555,17 @@ export async function startRemoteServer(ctx) {
     structuredLog.info('Shutting down remote server...');
     clearInterval(sessionCleanupInterval);
     connMonitor.stop();
-    for (const sid in transports) {
-      try { await transports[sid].close(); } catch {}
+    // Close all transports concurrently and cap the wait — one hung client
+    // must not hold the process open.
+    const closing = Object.keys(transports).map(sid => {
+      const t = transports[sid];
       delete transports[sid];
-    }
+      return Promise.resolve().then(() => t.close());
+    });
+    await Promise.race([
+      Promise.allSettled(closing),
+      new Promise(resolve => setTimeout(resolve, SHUTDOWN_TIMEOUT_MS).unref())
+    ]);
     process.exit(0);
   });
 } // end startRemoteServer
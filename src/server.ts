@@ -56,7 +56,7 @@ import {
   extractRelationships
 } from './intelligent-memory.js';
 import TokenStore from './auth/token-store.js';
-import { structuredLog, logStructured } from './lib/logger.js';
+import { structuredLog, logStructured, DEBUG } from './lib/logger.js';
 import {
   initApiClient,
   CircuitBreaker,
@@ -84,6 +84,7 @@ import {
   handleSaveInvestigation
 } from './tools/handlers.js';
 import { handleGenerateHandoffBrief } from './tools/handoff.js';
+import { executeBatch } from './tools/batch.js';
 import { createRequire } from 'module';
 import { fileURLToPath } from 'url';
 import path from 'path';
@@ -101,12 +102,6 @@ if (['setup', 'init', 'status', 'logout', 'hooks'].includes(_subcommand)) {
 
 const API_URL = (process.env.PURMEMO_API_URL || 'https://api.purmemo.ai').replace(/\/+$/, '');
 
-// Initialize extracted API client with URL + lazy key resolver
-initApiClient({
-  apiUrl: API_URL,
-  resolveApiKey: () => resolvedApiKey
-});
-
 // ============================================================================
 // Version check — runs once on startup, non-blocking
 // If the server reports this client is below min_required_version, every tool
@@ -121,6 +116,13 @@ try { CLIENT_VERSION = require('./package.json').version; } catch {
   try { CLIENT_VERSION = require('../package.json').version; } catch { /* unknown */ }
 }
 
+// Initialize extracted API client with URL + lazy key resolver
+initApiClient({
+  apiUrl: API_URL,
+  resolveApiKey: () => resolvedApiKey,
+  userAgent: `purmemo-mcp/${CLIENT_VERSION}`
+});
+
 let _updateNotice = null; // set to a string if an update is required
 
 function semverLt(a, b) {
@@ -153,11 +155,14 @@ async function checkForUpdates() {
 }
 
 // Read current Claude Code session_id from hook state file (written by session_start hook)
-// Returns null if not in a Claude Code session or state file unavailable
-function readCurrentSessionId() {
+// Returns null if not in a Claude Code session or state file unavailable.
+// Async: the hook state file grows with every session, and a readFileSync +
+// parse on each save stalled every other in-flight request (remote mode runs
+// saves for many users on one loop).
+const HOOK_STATE_FILE = path.join(os.homedir(), '.claude', 'hooks', 'purmemo_state.json');
+async function readCurrentSessionId() {
   try {
-    const stateFile = path.join(os.homedir(), '.claude', 'hooks', 'purmemo_state.json');
-    const state = JSON.parse(fs.readFileSync(stateFile, 'utf8'));
+    const state = JSON.parse(await fs.promises.readFile(HOOK_STATE_FILE, 'utf8'));
     return state.current_session_id || null;
   } catch {
     return null;
@@ -204,8 +209,8 @@ const PLATFORM = detectPlatform();
 // Never set by default — npm package users never see these tools.
 const ADMIN_MODE = process.env.PURMEMO_ADMIN === '1';
 
-// Log detected platform for debugging (only in development)
-if (process.env.NODE_ENV !== 'production') {
+// Log detected platform for debugging (PURMEMO_DEBUG=1)
+if (DEBUG) {
   structuredLog.debug('Platform detected', { platform: PLATFORM });
   structuredLog.debug('Admin mode', { admin_mode: ADMIN_MODE });
 }
@@ -1127,6 +1132,47 @@ No new data is generated — composes from your existing V2 intelligence extract
       },
       required: []
     }
+  },
+  {
+    name: 'batch_execute',
+    annotations: {
+      title: 'Batch Execute',
+      readOnlyHint: false,
+      destructiveHint: false,
+      idempotentHint: false,
+      openWorldHint: true
+    },
+    description: `Run several purmemo tool calls in one request. Use this when you already know you need multiple independent calls (e.g. several recall_memories queries, or saving a conversation plus its artifacts) — they run concurrently and come back together, instead of one round trip each.
+
+Returns a JSON array with one entry per operation, in input order: { name, isError, text }.
+Operations are independent: one failing does not stop the others. batch_execute cannot be nested.`,
+    inputSchema: {
+      type: 'object',
+      properties: {
+        operations: {
+          type: 'array',
+          description: 'Tool calls to run, each with the tool name and its arguments',
+          minItems: 1,
+          maxItems: 20,
+          items: {
+            type: 'object',
+            properties: {
+              name: { type: 'string', description: 'Tool name (any purmemo tool except batch_execute)' },
+              arguments: { type: 'object', description: 'Arguments for that tool' }
+            },
+            required: ['name']
+          }
+        },
+        maxConcurrent: {
+          type: 'integer',
+          description: 'Maximum operations in flight at once (default 4)',
+          minimum: 1,
+          maximum: 8,
+          default: 4
+        }
+      },
+      required: ['operations']
+    }
   }
 ];
 
@@ -1289,7 +1335,15 @@ const PROMPTS = [
 // Tool handlers extracted to ./tools/handlers.ts
 
 // Setup server
-server.setRequestHandler(ListToolsRequestSchema, async () => ({ tools: TOOLS }));
+// List handlers return static data synchronously — the SDK awaits whatever a
+// handler returns, so wrapping them in async only adds a promise per call.
+// The list results never change after startup, so each is built once and the
+// same object is returned on every call.
+const LIST_TOOLS_RESULT = { tools: TOOLS };
+const LIST_RESOURCES_RESULT = { resources: RESOURCES, resourceTemplates: RESOURCE_TEMPLATES };
+const LIST_PROMPTS_RESULT = { prompts: PROMPTS };
+
+server.setRequestHandler(ListToolsRequestSchema, () => LIST_TOOLS_RESULT);
 
 // Prepend update notice to a tool result if one is set
 function withUpdateNotice(result) {
@@ -1300,69 +1354,90 @@ function withUpdateNotice(result) {
   };
 }
 
-server.setRequestHandler(CallToolRequestSchema, async (request) => {
-  const { name, arguments: args } = request.params;
+// Tool name → handler, built once. Admin tools are gated at dispatch time.
+const TOOL_HANDLERS = {
+  'save_conversation': handleSaveConversation,
+  'save_artifact': handleSaveArtifact,
+  'recall_memories': handleRecallMemories,
+  'get_memory_details': handleGetMemoryDetails,
+  'discover_related_conversations': handleDiscoverRelated,
+  'get_user_context': handleGetUserContext,
+  'run_workflow': handleRunWorkflow,
+  'list_workflows': handleListWorkflows,
+  'share_memory': handleShareMemory,
+  'recall_public': handleRecallPublic,
+  'get_public_memory': handleGetPublicMemory,
+  'report_memory': handleReportMemory,
+  'get_acknowledged_errors': handleGetAcknowledgedErrors,
+  'save_investigation_result': handleSaveInvestigation,
+  'generate_handoff_brief': handleGenerateHandoffBrief,
+  'batch_execute': handleBatchExecute,
+};
+const ADMIN_TOOLS = new Set(['get_acknowledged_errors', 'save_investigation_result']);
 
-  // Track tool usage (for remote mode health endpoint)
-  if (typeof toolCallCounts !== 'undefined') {
-    toolCallCounts[name] = (toolCallCounts[name] || 0) + 1;
+// Unknown and (outside ADMIN_MODE) admin tools are answered without dispatch;
+// returns the reply for those, or null when the call may proceed
+function rejectToolCall(name) {
+  if (!Object.hasOwn(TOOL_HANDLERS, name)) {
+    return {
+      isError: true,
+      content: [{
+        type: 'text',
+        text: `❌ Unknown tool: ${name}`
+      }]
+    };
   }
-
-  switch (name) {
-    case 'save_conversation':
-      return withUpdateNotice(await handleSaveConversation(args));
-    case 'save_artifact':
-      return withUpdateNotice(await handleSaveArtifact(args));
-    case 'recall_memories':
-      return withUpdateNotice(await handleRecallMemories(args));
-    case 'get_memory_details':
-      return withUpdateNotice(await handleGetMemoryDetails(args));
-    case 'discover_related_conversations':
-      return withUpdateNotice(await handleDiscoverRelated(args));
-    case 'get_user_context':
-      return withUpdateNotice(await handleGetUserContext(args));
-    case 'run_workflow':
-      return withUpdateNotice(await handleRunWorkflow(args));
-    case 'list_workflows':
-      return withUpdateNotice(await handleListWorkflows(args));
-    case 'share_memory':
-      return withUpdateNotice(await handleShareMemory(args));
-    case 'recall_public':
-      return withUpdateNotice(await handleRecallPublic(args));
-    case 'get_public_memory':
-      return withUpdateNotice(await handleGetPublicMemory(args));
-    case 'report_memory':
-      return withUpdateNotice(await handleReportMemory(args));
-    case 'get_acknowledged_errors':
-      if (!ADMIN_MODE) return { content: [{ type: 'text', text: '❌ Admin access required. Set PURMEMO_ADMIN=1 and provide a valid admin API key.' }] };
-      return withUpdateNotice(await handleGetAcknowledgedErrors(args));
-    case 'save_investigation_result':
-      if (!ADMIN_MODE) return { content: [{ type: 'text', text: '❌ Admin access required. Set PURMEMO_ADMIN=1 and provide a valid admin API key.' }] };
-      return withUpdateNotice(await handleSaveInvestigation(args));
-    case 'generate_handoff_brief':
-      return withUpdateNotice(await handleGenerateHandoffBrief(args));
-    default:
-      return {
-        content: [{
-          type: 'text',
-          text: `❌ Unknown tool: ${name}`
-        }]
-      };
+  if (!ADMIN_MODE && ADMIN_TOOLS.has(name)) {
+    return { isError: true, content: [{ type: 'text', text: '❌ Admin access required. Set PURMEMO_ADMIN=1 and provide a valid admin API key.' }] };
   }
+  return null;
+}
+
+// batch_execute: independent tool calls in one request, run through the same
+// dispatch as single calls
+function handleBatchExecute(args) {
+  return executeBatch(args, async (name, opArgs) => rejectToolCall(name) || TOOL_HANDLERS[name](opArgs));
+}
+
+server.setRequestHandler(CallToolRequestSchema, async (request) => {
+  const { name, arguments: args } = request.params;
+
+  const rejection = rejectToolCall(name);
+  if (rejection) return rejection;
+  return withUpdateNotice(await TOOL_HANDLERS[name](args));
 });
 
 // ============================================================================
 // TIER 4: Resource Handlers (MCP 2025-11-25)
 // ============================================================================
 
-server.setRequestHandler(ListResourcesRequestSchema, async () => {
+server.setRequestHandler(ListResourcesRequestSchema, () => {
   structuredLog.info('resources/list called');
-  return {
-    resources: RESOURCES,
-    resourceTemplates: RESOURCE_TEMPLATES
-  };
+  return LIST_RESOURCES_RESULT;
 });
 
+// Widget HTML ships with the package and never changes while the server runs:
+// the map and directory are resolved once, and each file is read from disk
+// on first request only (previously three dynamic imports + a sync read per call)
+const WIDGET_FILES = {
+  'ui://widgets/recall-v39.html': 'recall.html',
+  'ui://widgets/save.html': 'save.html',
+  'ui://widgets/memory-detail.html': 'memory-detail.html',
+  'ui://widgets/context.html': 'context.html',
+  'ui://widgets/discover.html': 'discover.html'
+};
+const WIDGETS_DIR = path.join(path.dirname(fileURLToPath(import.meta.url)), 'remote', 'widgets');
+const widgetHtmlCache = new Map();
+
+function readWidgetHtml(fileName) {
+  let html = widgetHtmlCache.get(fileName);
+  if (html === undefined) {
+    html = fs.readFileSync(path.join(WIDGETS_DIR, fileName), 'utf8');
+    widgetHtmlCache.set(fileName, html);
+  }
+  return html;
+}
+
 server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
   const { uri } = request.params;
   const requestId = `resource_read_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
@@ -1503,21 +1578,10 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
 
     } else if (uri.startsWith('ui://widgets/')) {
       // Serve ChatGPT Apps SDK widget HTML
-      const widgetMap = {
-        'ui://widgets/recall-v39.html': 'recall.html',
-        'ui://widgets/save.html': 'save.html',
-        'ui://widgets/memory-detail.html': 'memory-detail.html',
-        'ui://widgets/context.html': 'context.html',
-        'ui://widgets/discover.html': 'discover.html'
-      };
-      const fileName = widgetMap[uri];
+      const fileName = Object.hasOwn(WIDGET_FILES, uri) ? WIDGET_FILES[uri] : undefined;
       if (!fileName) throw new Error(`Unknown widget: ${uri}`);
 
-      const { readFileSync: readFs } = await import('node:fs');
-      const { dirname: dn, join: jn } = await import('node:path');
-      const { fileURLToPath: fu } = await import('node:url');
-      const widgetPath = jn(dn(fu(import.meta.url)), 'remote', 'widgets', fileName);
-      const html = readFs(widgetPath, 'utf8');
+      const html = readWidgetHtml(fileName);
 
       return {
         contents: [{ uri: resourceUri, mimeType: 'text/html+skybridge', text: html }]
@@ -1527,10 +1591,10 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
       // Fetch specific memory by ID
       const memoryId = uri.replace('memory://', '');
       if (!memoryId) throw new Error('Memory ID is required in URI: memory://{memoryId}');
-      data = await makeApiCall(`/api/v1/memories/${memoryId}/`, { method: 'GET' });
+      data = await makeApiCall(`/api/v1/memories/${encodeURIComponent(memoryId)}/`, { method: 'GET' });
 
       return {
-        contents: [{ uri: resourceUri, mimeType: 'application/json', text: JSON.stringify(data, null, 2) }]
+        contents: [{ uri: resourceUri, mimeType: 'application/json', text: JSON.stringify(data) }]
       };
 
     } else {
@@ -1553,9 +1617,9 @@ server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
 // TIER 4: Prompt Handlers (MCP 2025-11-25)
 // ============================================================================
 
-server.setRequestHandler(ListPromptsRequestSchema, async () => {
+server.setRequestHandler(ListPromptsRequestSchema, () => {
   structuredLog.info('prompts/list called');
-  return { prompts: PROMPTS };
+  return LIST_PROMPTS_RESULT;
 });
 
 server.setRequestHandler(GetPromptRequestSchema, async (request) => {
@@ -1632,6 +1696,14 @@ server.setRequestHandler(GetPromptRequestSchema, async (request) => {
 // Startup: resolve API key (env var → ~/.purmemo/auth.json) then connect
 // ============================================================================
 
+// The saved token is read and decrypted at most once per process — the
+// interactive-terminal check and resolveApiKey() both need it at startup
+let storedTokenPromise = null;
+function readStoredToken() {
+  storedTokenPromise ??= new TokenStore().getToken();
+  return storedTokenPromise;
+}
+
 async function resolveApiKey() {
   // Priority 1: explicit env var
   if (process.env.PURMEMO_API_KEY) {
@@ -1641,8 +1713,7 @@ async function resolveApiKey() {
 
   // Priority 2: token saved by `npx purmemo-mcp setup`
   try {
-    const tokenStore = new TokenStore();
-    const token = await tokenStore.getToken();
+    const token = await readStoredToken();
     if (token?.access_token) {
       structuredLog.info('API key resolved from ~/.purmemo/auth.json (run via npx purmemo-mcp setup)');
       return token.access_token;
@@ -1685,8 +1756,7 @@ if (REMOTE_MODE) {
   // If running interactively in a terminal (not piped by an MCP client) and
   // no auth is configured, redirect to setup instead of silently hanging.
   if (process.stdin.isTTY && !process.env.PURMEMO_API_KEY) {
-    const _ts = new TokenStore();
-    const _tok = await _ts.getToken();
+    const _tok = await readStoredToken();
     if (!_tok?.access_token) {
       console.log('\n🧠 pūrmemo MCP — Memory for your AI tools\n');
       console.log('Not connected yet. Run setup to get started:\n');
@@ -68,7 +68,7 @@ async function runSetup() {
       console.log(chalk.yellow('⚡ Switching account…'));
       // fall through to the API key auth path below
     } else {
-      const info = await tokenStore.getUserInfo();
+      const info = await tokenStore.getUserInfo(existing);
       console.log(chalk.green('✅ Already connected!'));
       console.log(chalk.gray(`   Account: ${info?.email || 'unknown'}`));
       console.log(chalk.gray(`   Tier:    ${info?.tier || 'free'}`));
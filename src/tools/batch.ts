@@ -0,0 +1,58 @@
+// @ts-nocheck — typing deferred (matches server.ts convention)
+/**
+ * batch_execute — several independent tool calls in one request.
+ *
+ * Validation, the concurrency cap and result reduction live here so stdio and
+ * remote mode behave identically; each mode passes its own dispatch(name, args)
+ * (stdio: the local handler table, remote: local/proxied routing).
+ */
+
+import { structuredLog } from '../lib/logger.js';
+import { safeErrorMessage } from '../lib/api-client.js';
+import { mapWithConcurrency } from './handlers.js';
+
+export const BATCH_TOOL_NAME = 'batch_execute';
+export const BATCH_MAX_OPERATIONS = 20;
+export const BATCH_DEFAULT_CONCURRENCY = 4;
+export const BATCH_MAX_CONCURRENCY = 8;
+
+/** Reduce a tool result to its text content (or the raw payload for proxied JSON). */
+function resultText(result) {
+  if (result?.content) return result.content.filter(c => c.type === 'text').map(c => c.text).join('\n\n');
+  return JSON.stringify(result?.data || result);
+}
+
+/**
+ * Run each operation through dispatch with at most maxConcurrent in flight.
+ * Returns one { name, isError, text } per operation, in input order; a failed
+ * operation never stops the others. Invalid batches are rejected whole.
+ */
+export async function executeBatch(args, dispatch) {
+  const operations = args?.operations;
+  if (!Array.isArray(operations) || operations.length === 0 || operations.length > BATCH_MAX_OPERATIONS) {
+    return {
+      isError: true,
+      content: [{ type: 'text', text: `❌ ${BATCH_TOOL_NAME} needs between 1 and ${BATCH_MAX_OPERATIONS} operations` }]
+    };
+  }
+  const requested = parseInt(args.maxConcurrent, 10);
+  const maxConcurrent = Math.min(BATCH_MAX_CONCURRENCY, Math.max(1, Number.isNaN(requested) ? BATCH_DEFAULT_CONCURRENCY : requested));
+
+  const results = await mapWithConcurrency(operations, maxConcurrent, async (op) => {
+    const name = op?.name;
+    if (typeof name !== 'string' || !name) return { name, isError: true, text: '❌ Missing tool name' };
+    if (name === BATCH_TOOL_NAME) return { name, isError: true, text: `❌ ${BATCH_TOOL_NAME} cannot be nested` };
+    try {
+      const result = await dispatch(name, op.arguments || {});
+      return { name, isError: !!result?.isError, text: resultText(result) };
+    } catch (error) {
+      return { name, isError: true, text: `❌ ${safeErrorMessage(error)}` };
+    }
+  });
+
+  structuredLog.info(`${BATCH_TOOL_NAME}: completed`, {
+    operations: operations.length,
+    failed: results.filter(r => r.isError).length
+  });
+  return { content: [{ type: 'text', text: JSON.stringify(results) }] };
+}
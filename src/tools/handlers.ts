@@ -6,8 +6,9 @@
  * Call initHandlers() once at startup to inject server-scoped dependencies.
  */
 
-import { structuredLog } from '../lib/logger.js';
-import { makeApiCall, sanitizeUnicode, safeErrorMessage } from '../lib/api-client.js';
+import { setImmediate as yieldToEventLoop } from 'node:timers/promises';
+import { structuredLog, DEBUG } from '../lib/logger.js';
+import { makeApiCall, makeCachedApiCall, sanitizeUnicode, safeErrorMessage } from '../lib/api-client.js';
 import {
   extractProjectContext,
   generateIntelligentTitle,
@@ -20,18 +21,48 @@ import {
   buildMemoryQueries
 } from '../workflows/engine.js';
 
+// Memory endpoints share one base path; ids are percent-encoded when appended
+// so a caller-supplied id can never change the route (e.g. "../admin").
+const MEMORIES_PATH = '/api/v1/memories/';
+const memoryPath = (id, suffix = '') => MEMORIES_PATH + encodeURIComponent(id) + suffix;
+const PUBLIC_MEMORIES_PATH = MEMORIES_PATH + 'public';
+const publicMemoryPath = (id) => `${PUBLIC_MEMORIES_PATH}/${encodeURIComponent(id)}`;
+// Backend tool execution endpoint. makeApiCall's shared base headers already
+// carry Content-Type: JSON — passing it again forced a fresh merged headers
+// object per request instead of reusing the frozen base.
+const TOOLS_EXECUTE_PATH = '/api/v10/mcp/tools/execute';
+const UUID_RE = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+const SLUG_SEPARATOR_RE = /[^a-z0-9]+/g;
+const SLUG_EDGE_RE = /^-+|-+$/g;
+
+// Lowercase, hyphen-separated slug used for deterministic conversation ids
+function slugify(text, maxLength) {
+  return text.toLowerCase()
+    .replace(SLUG_SEPARATOR_RE, '-')
+    .replace(SLUG_EDGE_RE, '')
+    .substring(0, maxLength);
+}
+
+// Content analysis is synchronous regex work — ~300ms for an 800KB transcript.
+// Remote mode serves many users on one event loop, so above this size the
+// save yields between analysis passes to let queued requests run.
+const ANALYSIS_YIELD_MIN_CHARS = 50_000;
+
+// /auth/me (email + identity profile) is near-static; reuse it for a minute
+const ME_CACHE_TTL_MS = 60_000;
+
 // ============================================================================
 // Module state — set via initHandlers()
 // ============================================================================
 
 let PLATFORM = 'claude';
-let readCurrentSessionId: () => string | null = () => null;
+let readCurrentSessionId: () => Promise<string | null> = async () => null;
 
 export function initHandlers(deps: {
   platform: string;
   getLastRecallIds: () => string[];
   setLastRecallIds: (ids: string[]) => void;
-  readCurrentSessionId: () => string | null;
+  readCurrentSessionId: () => Promise<string | null>;
 }) {
   PLATFORM = deps.platform;
   _getLastRecallIds = deps.getLastRecallIds;
@@ -43,6 +74,38 @@ export function initHandlers(deps: {
 let _getLastRecallIds: () => string[] = () => lastRecallIds;
 let _setLastRecallIds: (ids: string[]) => void = (ids) => { lastRecallIds = ids; };
 
+// Recent recall_memories responses, keyed on the exact upstream request body.
+// Agents often repeat the same recall within a turn or two; a hit skips the
+// backend search entirely. Map insertion order doubles as LRU order (hits are
+// re-inserted), and the whole cache is dropped once any memory write settles —
+// failed ones included, since a write may land even when the call errors — so
+// a save is always visible to the next recall. Handlers run with the process-
+// wide API key, so entries are never shared across users.
+const RECALL_CACHE_MAX = 128;
+const RECALL_CACHE_TTL_MS = 30_000;
+const recallCache = new Map();
+
+function getCachedRecall(key) {
+  const entry = recallCache.get(key);
+  if (!entry) return undefined;
+  recallCache.delete(key);
+  if (Date.now() - entry.at > RECALL_CACHE_TTL_MS) return undefined;
+  recallCache.set(key, entry);
+  return entry.data;
+}
+
+function invalidateRecallCache() {
+  recallCache.clear();
+}
+
+function setCachedRecall(key, data) {
+  recallCache.delete(key);
+  recallCache.set(key, { at: Date.now(), data });
+  if (recallCache.size > RECALL_CACHE_MAX) {
+    recallCache.delete(recallCache.keys().next().value);
+  }
+}
+
 // ============================================================================
 // Content helpers
 // ============================================================================
@@ -145,16 +208,42 @@ function chunkContent(content, maxChunkSize = 20000) {
   return chunks;
 }
 
+// Part uploads are independent upserts (one conversation_id each), so they
+// are sent a few at a time instead of one round trip after another.
+// Network-bound, so CPU count is irrelevant; PURMEMO_SAVE_CONCURRENCY
+// overrides the default (clamped to 1–16 to stay clear of API rate limits).
+const requestedSaveConcurrency = parseInt(process.env.PURMEMO_SAVE_CONCURRENCY || '', 10);
+const CHUNK_SAVE_CONCURRENCY = Math.min(16, Math.max(1, Number.isNaN(requestedSaveConcurrency) ? 4 : requestedSaveConcurrency));
+
+/**
+ * Run fn over items with at most `limit` in flight; results keep input order.
+ * Rejects with the first failure, and no further items are started after it.
+ */
+export async function mapWithConcurrency(items, limit, fn) {
+  const results = new Array(items.length);
+  let next = 0;
+  let failed = false;
+  const worker = async () => {
+    while (!failed && next < items.length) {
+      const i = next++;
+      try {
+        results[i] = await fn(items[i], i);
+      } catch (error) {
+        failed = true;
+        throw error;
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
 async function saveChunkedContent(content, title, tags = [], metadata = {}) {
   // Derive a deterministic session ID from the conversation_id (title slug).
   // This ensures re-saves of the same conversation overwrite existing chunks
   // via the backend's ON CONFLICT (user_id, platform, conversation_id) upsert,
   // instead of creating duplicate chunk sets with random session IDs.
-  const conversationId = metadata.conversationId || title
-    .toLowerCase()
-    .replace(/[^a-z0-9]+/g, '-')
-    .replace(/^-+|-+$/g, '')
-    .substring(0, 80);
+  const conversationId = metadata.conversationId || slugify(title, 80);
   const sessionId = conversationId;
   const chunks = chunkContent(content);
   const totalParts = chunks.length;
@@ -165,14 +254,11 @@ async function saveChunkedContent(content, title, tags = [], metadata = {}) {
     total_parts: totalParts
   });
 
-  const savedParts = [];
-
   // Save each chunk — uses deterministic conversation_id so re-saves upsert
-  for (let i = 0; i < chunks.length; i++) {
+  const savedParts = await mapWithConcurrency(chunks, CHUNK_SAVE_CONCURRENCY, async (chunk, i) => {
     const partNumber = i + 1;
-    const chunk = chunks[i];
 
-    const partData = await makeApiCall('/api/v1/memories/', {
+    const partData = await makeApiCall(MEMORIES_PATH, {
       method: 'POST',
       body: JSON.stringify({
         content: chunk,
@@ -193,16 +279,19 @@ async function saveChunkedContent(content, title, tags = [], metadata = {}) {
     });
 
     const partMemoryId = partData.id || partData.memory_id;
-    savedParts.push({ partNumber, memoryId: partMemoryId, size: chunk.length });
-
-    structuredLog.debug('Chunk saved', {
-      session_id: sessionId,
-      part_number: partNumber,
-      total_parts: totalParts,
-      chunk_size: chunk.length,
-      memory_id: partData.id || partData.memory_id
-    });
-  }
+
+    if (DEBUG) {
+      structuredLog.debug('Chunk saved', {
+        session_id: sessionId,
+        part_number: partNumber,
+        total_parts: totalParts,
+        chunk_size: chunk.length,
+        memory_id: partMemoryId
+      });
+    }
+
+    return { partNumber, memoryId: partMemoryId, size: chunk.length };
+  }).finally(invalidateRecallCache);
 
   // If re-chunk count decreased (e.g., content got shorter), orphaned parts
   // from previous saves remain but won't be linked. They'll be naturally
@@ -211,7 +300,7 @@ async function saveChunkedContent(content, title, tags = [], metadata = {}) {
   // Create index memory — also uses deterministic conversation_id for upsert
   const indexContent = `# ${title} - Complete Capture Index\n\n## Capture Summary\n- Total Parts: ${totalParts}\n- Total Size: ${content.length} characters\n- Session ID: ${sessionId}\n- Saved: ${new Date().toISOString()}\n\n## Parts Overview\n${savedParts.map(p => `- Part ${p.partNumber}: ${p.size} chars [${p.memoryId}]`).join('\n')}\n\n## Metadata\n${JSON.stringify(metadata, null, 2)}\n\n## Full Content Access\nUse recall_memories with session:${sessionId} to find all parts, or use get_memory_details with any part ID.`;
 
-  const indexData = await makeApiCall('/api/v1/memories/', {
+  const indexData = await makeApiCall(MEMORIES_PATH, {
     method: 'POST',
     body: JSON.stringify({
       content: indexContent,
@@ -229,7 +318,7 @@ async function saveChunkedContent(content, title, tags = [], metadata = {}) {
         isComplete: true
       }
     })
-  });
+  }).finally(invalidateRecallCache);
 
   structuredLog.info('Chunked content save complete', {
     session_id: sessionId,
@@ -247,10 +336,12 @@ async function saveChunkedContent(content, title, tags = [], metadata = {}) {
 }
 
 async function saveSingleContent(content, title, tags = [], metadata = {}) {
-  structuredLog.debug('Saving single content', {
-    char_count: content.length,
-    title
-  });
+  if (DEBUG) {
+    structuredLog.debug('Saving single content', {
+      char_count: content.length,
+      title
+    });
+  }
 
   // Use POST /api/v1/memories/ with conversation_id for atomic ON CONFLICT upsert.
   // This is the single correct path — the backend handles:
@@ -259,7 +350,7 @@ async function saveSingleContent(content, title, tags = [], metadata = {}) {
   //   - embedding_status = 'pending' on both insert and update
   //   - processMemoryBackground() for embedding + intelligence extraction
   //   - Soft-delete revival (restores trashed memories on re-save)
-  const sessionId = readCurrentSessionId();
+  const sessionId = await readCurrentSessionId();
   const payload: Record<string, unknown> = {
     content,
     title,
@@ -276,10 +367,10 @@ async function saveSingleContent(content, title, tags = [], metadata = {}) {
   // Only include session_id if it's a real string (Zod rejects null)
   if (sessionId) payload.session_id = sessionId;
 
-  const data = await makeApiCall('/api/v1/memories/', {
+  const data = await makeApiCall(MEMORIES_PATH, {
     method: 'POST',
     body: JSON.stringify(payload)
-  });
+  }).finally(invalidateRecallCache);
 
   const memoryId = data.id || data.memory_id;
   const wasUpdated = data.updated === true;
@@ -325,8 +416,8 @@ function formatWisdomSuggestion(wisdomSuggestion) {
 
 export async function handleSaveConversation(args) {
   const toolName = 'save_conversation';
-  const requestId = `${toolName}_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
   const startTime = Date.now();
+  const requestId = `${toolName}_${startTime}_${Math.random().toString(36).substr(2, 6)}`;
 
   structuredLog.info(`${toolName}: starting`, {
     tool_name: toolName,
@@ -338,46 +429,6 @@ export async function handleSaveConversation(args) {
     const content = sanitizeUnicode(rawContent);
     const contentLength = content.length;
 
-    structuredLog.debug('Extracting intelligent context', {
-      request_id: requestId,
-      content_length: contentLength
-    });
-
-    const intelligentContext = extractProjectContext(content);
-
-    let title = args.title;
-    if (!title || title.startsWith('Conversation 202')) {
-      title = generateIntelligentTitle(intelligentContext, content);
-      structuredLog.debug('Generated intelligent title', {
-        request_id: requestId,
-        title
-      });
-    }
-
-    const progressIndicators = extractProgressIndicators(content);
-    const relationships = extractRelationships(content);
-
-    // args.tags may arrive as a JSON string from some MCP transports — parse it
-    let rawTags = args.tags;
-    if (typeof rawTags === 'string') {
-      try { rawTags = JSON.parse(rawTags); } catch { rawTags = [rawTags]; }
-    }
-    const tags: string[] = Array.isArray(rawTags) ? rawTags : (rawTags ? [String(rawTags)] : ['complete-conversation']);
-
-    let conversationId = args.conversationId;
-    if (!conversationId && title && !title.startsWith('Conversation 202')) {
-      conversationId = title
-        .toLowerCase()
-        .replace(/[^a-z0-9]+/g, '-')
-        .replace(/^-+|-+$/g, '')
-        .substring(0, 100);
-
-      structuredLog.debug('Generated conversation ID from title', {
-        request_id: requestId,
-        conversation_id: conversationId
-      });
-    }
-
     if (contentLength < 100) {
       structuredLog.warn('Insufficient content detected', {
         request_id: requestId,
@@ -385,6 +436,7 @@ export async function handleSaveConversation(args) {
       });
 
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `❌ INSUFFICIENT CONTENT DETECTED!\n\n` +
@@ -414,6 +466,7 @@ export async function handleSaveConversation(args) {
       });
 
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `⚠️ POSSIBLE SUMMARY DETECTED!\n\n` +
@@ -428,6 +481,57 @@ export async function handleSaveConversation(args) {
       };
     }
 
+    // Identity Layer: start the session-context lookup now so its round trip
+    // overlaps the content analysis below instead of serialising ahead of the save
+    const sessionPromise = makeApiCall(`/api/v1/identity/session?platform=${encodeURIComponent(PLATFORM)}`);
+    sessionPromise.catch(() => {});
+
+    if (DEBUG) {
+      structuredLog.debug('Extracting intelligent context', {
+        request_id: requestId,
+        content_length: contentLength
+      });
+    }
+
+    const yieldBetweenPasses = contentLength >= ANALYSIS_YIELD_MIN_CHARS;
+    const intelligentContext = extractProjectContext(content);
+    if (yieldBetweenPasses) await yieldToEventLoop();
+
+    let title = args.title;
+    if (!title || title.startsWith('Conversation 202')) {
+      title = generateIntelligentTitle(intelligentContext, content);
+      if (yieldBetweenPasses) await yieldToEventLoop();
+      if (DEBUG) {
+        structuredLog.debug('Generated intelligent title', {
+          request_id: requestId,
+          title
+        });
+      }
+    }
+
+    const progressIndicators = extractProgressIndicators(content);
+    const relationships = extractRelationships(content);
+    if (yieldBetweenPasses) await yieldToEventLoop();
+
+    // args.tags may arrive as a JSON string from some MCP transports — parse it
+    let rawTags = args.tags;
+    if (typeof rawTags === 'string') {
+      try { rawTags = JSON.parse(rawTags); } catch { rawTags = [rawTags]; }
+    }
+    const tags: string[] = Array.isArray(rawTags) ? rawTags : (rawTags ? [String(rawTags)] : ['complete-conversation']);
+
+    let conversationId = args.conversationId;
+    if (!conversationId && title && !title.startsWith('Conversation 202')) {
+      conversationId = slugify(title, 100);
+
+      if (DEBUG) {
+        structuredLog.debug('Generated conversation ID from title', {
+          request_id: requestId,
+          conversation_id: conversationId
+        });
+      }
+    }
+
     const metadata = extractContentMetadata(content);
 
     // Living document is now handled atomically by the backend's ON CONFLICT clause.
@@ -444,7 +548,7 @@ export async function handleSaveConversation(args) {
 
     // Identity Layer: attach session context to new memories
     try {
-      const sessionResp = await makeApiCall(`/api/v1/identity/session?platform=${encodeURIComponent(PLATFORM)}`);
+      const sessionResp = await sessionPromise;
       const sess = sessionResp.session || {};
       if (sess.id || sess.context || sess.project) {
         metadata.session_context = {
@@ -454,7 +558,9 @@ export async function handleSaveConversation(args) {
           focus: sess.focus,
           platform: PLATFORM
         };
-        structuredLog.debug('Attached session context to memory', { project: sess.project });
+        if (DEBUG) {
+          structuredLog.debug('Attached session context to memory', { project: sess.project });
+        }
       }
     } catch (sessionErr) {
       // Non-fatal — save proceeds without session context
@@ -557,6 +663,7 @@ export async function handleSaveConversation(args) {
     });
 
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Save Error: ${errorMsg}\n\nPlease try again or contact support if the issue persists.`
@@ -568,8 +675,8 @@ export async function handleSaveConversation(args) {
 // ADR-025: Save artifact as first-class object linked to a conversation
 export async function handleSaveArtifact(args) {
   const toolName = 'save_artifact';
-  const requestId = `${toolName}_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
   const startTime = Date.now();
+  const requestId = `${toolName}_${startTime}_${Math.random().toString(36).substr(2, 6)}`;
 
   structuredLog.info(`${toolName}: starting`, {
     tool_name: toolName,
@@ -597,6 +704,7 @@ export async function handleSaveArtifact(args) {
       if (content.length < 100) missing.push(`content (${content.length} chars, minimum 100)`);
 
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `❌ Missing or invalid fields: ${missing.join(', ')}\n\nAll fields (conversationId, title, type, content) are required. Content must be at least 100 characters.`
@@ -605,14 +713,10 @@ export async function handleSaveArtifact(args) {
     }
 
     // Generate deterministic conversation_id for the artifact
-    const artifactSlug = title
-      .toLowerCase()
-      .replace(/[^a-z0-9]+/g, '-')
-      .replace(/^-+|-+$/g, '')
-      .substring(0, 60);
+    const artifactSlug = slugify(title, 60);
     const artifactConversationId = `${parentConversationId}:artifact:${artifactSlug}`;
 
-    const sessionId = readCurrentSessionId();
+    const sessionId = await readCurrentSessionId();
     const payload = {
       content,
       title,
@@ -633,10 +737,10 @@ export async function handleSaveArtifact(args) {
       ...(sessionId && { session_id: sessionId }),
     };
 
-    const data = await makeApiCall('/api/v1/memories/', {
+    const data = await makeApiCall(MEMORIES_PATH, {
       method: 'POST',
       body: JSON.stringify(payload),
-    });
+    }).finally(invalidateRecallCache);
 
     const memoryId = data.id || data.memory_id;
     const wasUpdated = data.updated === true;
@@ -679,6 +783,7 @@ export async function handleSaveArtifact(args) {
     });
 
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Save Artifact Error: ${errorMsg}\n\nPlease try again or contact support if the issue persists.`
@@ -689,8 +794,8 @@ export async function handleSaveArtifact(args) {
 
 export async function handleDiscoverRelated(args) {
   const toolName = 'discover_related_conversations';
-  const requestId = `${toolName}_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
   const startTime = Date.now();
+  const requestId = `${toolName}_${startTime}_${Math.random().toString(36).substr(2, 6)}`;
 
   structuredLog.info(`${toolName}: starting`, {
     tool_name: toolName,
@@ -700,11 +805,8 @@ export async function handleDiscoverRelated(args) {
   try {
     const safeQuery = sanitizeUnicode(args.query || '');
 
-    const data = await makeApiCall(`/api/v10/mcp/tools/execute`, {
+    const data = await makeApiCall(TOOLS_EXECUTE_PATH, {
       method: 'POST',
-      headers: {
-        'Content-Type': 'application/json'
-      },
       body: JSON.stringify({
         tool: 'discover_related_conversations',
         arguments: {
@@ -757,6 +859,7 @@ export async function handleDiscoverRelated(args) {
 
     if (error.message && error.message.includes('429')) {
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `⚠️ Monthly recall quota exceeded.\n\n${errorMsg}\n\nNote: 'discover_related_conversations' shares the same quota pool as 'recall_memories'.`
@@ -765,6 +868,7 @@ export async function handleDiscoverRelated(args) {
     }
 
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Discovery Error: ${errorMsg}\n\nThis could be due to:\n- Monthly quota limit reached (check with your API provider)\n- Network connectivity issues\n- API endpoint changes\n\nTry using 'recall_memories' for basic search, or upgrade to PRO for unlimited recalls.`
@@ -775,8 +879,8 @@ export async function handleDiscoverRelated(args) {
 
 export async function handleRecallMemories(args) {
   const toolName = 'recall_memories';
-  const requestId = `${toolName}_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
   const startTime = Date.now();
+  const requestId = `${toolName}_${startTime}_${Math.random().toString(36).substr(2, 6)}`;
 
   structuredLog.info(`${toolName}: starting`, {
     tool_name: toolName,
@@ -785,26 +889,33 @@ export async function handleRecallMemories(args) {
 
   try {
     const safeQuery = sanitizeUnicode(args.query || '');
-
-    const data = await makeApiCall(`/api/v10/mcp/tools/execute`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json'
-      },
-      body: JSON.stringify({
-        tool: 'recall_memories',
-        arguments: {
-          query: args.query,
-          limit: parseInt(args.limit) || 10,
-          entity: args.entity,
-          initiative: args.initiative,
-          stakeholder: args.stakeholder,
-          deadline: args.deadline,
-          intent: args.intent,
-          has_observations: args.has_observations
-        }
-      })
+    const limit = parseInt(args.limit) || 10;
+
+    // Ask for one extra row: if it comes back there is another page, so the
+    // caller learns that without a follow-up recall that returns nothing.
+    const body = JSON.stringify({
+      tool: 'recall_memories',
+      arguments: {
+        query: args.query,
+        limit: limit + 1,
+        entity: args.entity,
+        initiative: args.initiative,
+        stakeholder: args.stakeholder,
+        deadline: args.deadline,
+        intent: args.intent,
+        has_observations: args.has_observations
+      }
     });
+    let data = getCachedRecall(body);
+    if (data === undefined) {
+      data = await makeApiCall(TOOLS_EXECUTE_PATH, {
+        method: 'POST',
+        body
+      });
+      setCachedRecall(body, data);
+    } else if (DEBUG) {
+      structuredLog.debug(`${toolName}: cache hit`, { request_id: requestId });
+    }
 
     if (!data.content || !data.content[0] || !data.content[0].text) {
       structuredLog.warn(`${toolName}: no results found`, {
@@ -823,7 +934,9 @@ export async function handleRecallMemories(args) {
 
     const responseText = data.content[0].text;
 
-    const memoryBlocks = responseText.split('\n\n').filter(block => block.includes('**') && block.includes('ID:'));
+    const allBlocks = responseText.split('\n\n').filter(block => block.includes('**') && block.includes('ID:'));
+    const hasMore = allBlocks.length > limit;
+    const memoryBlocks = hasMore ? allBlocks.slice(0, limit) : allBlocks;
 
     if (memoryBlocks.length === 0) {
       structuredLog.info(`${toolName}: completed`, {
@@ -888,6 +1001,10 @@ export async function handleRecallMemories(args) {
       resultText += todosMatch[0] + '\n\n';
     }
 
+    if (hasMore) {
+      resultText += `📄 More results available — call again with a higher \`limit\` (currently ${limit}) to see them.\n\n`;
+    }
+
     resultText += `${'─'.repeat(60)}\n\n`;
     resultText += `💡 **Discover More:**\n`;
     resultText += `Use 'discover_related_conversations' with your query to find related\n`;
@@ -901,6 +1018,7 @@ export async function handleRecallMemories(args) {
       request_id: requestId,
       duration_ms: Date.now() - startTime,
       results_count: memoryBlocks.length,
+      has_more: hasMore,
       response_size: finalSanitizedText.length
     });
 
@@ -920,6 +1038,7 @@ export async function handleRecallMemories(args) {
     });
 
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Recall Error: ${errorMsg}`
@@ -930,14 +1049,13 @@ export async function handleRecallMemories(args) {
 
 export async function handleGetMemoryDetails(args) {
   const toolName = 'get_memory_details';
-  const requestId = `${toolName}_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
   const startTime = Date.now();
+  const requestId = `${toolName}_${startTime}_${Math.random().toString(36).substr(2, 6)}`;
 
   // Resolve ordinal IDs ("1", "2", etc.) to UUIDs from last recall_memories result
   let resolvedId = args.memoryId;
-  const uuidPattern = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
 
-  if (!uuidPattern.test(resolvedId)) {
+  if (!UUID_RE.test(resolvedId)) {
     const currentIds = _getLastRecallIds();
     const ordinal = parseInt(resolvedId, 10);
     if (ordinal >= 1 && ordinal <= currentIds.length) {
@@ -953,6 +1071,7 @@ export async function handleGetMemoryDetails(args) {
         ? `Valid range: 1-${currentIds.length} (from last recall), or use a full UUID.`
         : 'Run recall_memories first to enable ordinal lookups, or use a full UUID.';
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `❌ Invalid memory ID: "${args.memoryId}"\n\n${hint}\n\nMemory IDs are UUIDs like: 951be873-8364-400a-8075-50e8650b67a9`
@@ -970,11 +1089,8 @@ export async function handleGetMemoryDetails(args) {
   });
 
   try {
-    const data = await makeApiCall(`/api/v10/mcp/tools/execute`, {
+    const data = await makeApiCall(TOOLS_EXECUTE_PATH, {
       method: 'POST',
-      headers: {
-        'Content-Type': 'application/json'
-      },
       body: JSON.stringify({
         tool: 'get_memory_details',
         arguments: {
@@ -994,6 +1110,7 @@ export async function handleGetMemoryDetails(args) {
       });
 
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `❌ Memory not found or invalid response\n\nMemory ID: ${resolvedId}`
@@ -1035,6 +1152,7 @@ export async function handleGetMemoryDetails(args) {
     });
 
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Error retrieving memory: ${errorMsg}\n\nMemory ID: ${resolvedId}\n\nCheck logs for full details.`
@@ -1053,9 +1171,9 @@ export async function handleGetUserContext(args) {
   try {
     // Fetch identity, session context, and recent memories in parallel
     const [identityResponse, sessionResponse, recentResponse] = await Promise.allSettled([
-      makeApiCall('/api/v1/auth/me'),
+      makeCachedApiCall('/api/v1/auth/me', ME_CACHE_TTL_MS),
       makeApiCall('/api/v1/identity/session'),
-      makeApiCall('/api/v1/memories/?limit=20&sort=created_at&order=desc&include_source_types=desktop_clipboard,manual,chrome_extension', { method: 'GET' })
+      makeApiCall(`${MEMORIES_PATH}?limit=20&sort=created_at&order=desc&include_source_types=desktop_clipboard,manual,chrome_extension`, { method: 'GET' })
     ]);
 
     // Extract identity from /me response
@@ -1065,7 +1183,9 @@ export async function handleGetUserContext(args) {
       const me = identityResponse.value;
       identity = me.identity || {};
       userEmail = me.email;
-      structuredLog.debug('Identity loaded', { email: userEmail });
+      if (DEBUG) {
+        structuredLog.debug('Identity loaded', { email: userEmail });
+      }
     } else {
       structuredLog.warn('Identity fetch failed', { error_message: String(identityResponse.reason) });
     }
@@ -1074,7 +1194,9 @@ export async function handleGetUserContext(args) {
     let session = {};
     if (sessionResponse.status === 'fulfilled') {
       session = sessionResponse.value.session || {};
-      structuredLog.debug('Session loaded', { project: session.project, context: session.context });
+      if (DEBUG) {
+        structuredLog.debug('Session loaded', { project: session.project, context: session.context });
+      }
     } else {
       structuredLog.warn('Session fetch failed', { error_message: String(sessionResponse.reason) });
     }
@@ -1107,7 +1229,9 @@ export async function handleGetUserContext(args) {
           });
           memorySummary = 'Recently working on: ' + parts.join('; ') + '.';
         }
-        structuredLog.debug('Recent memories loaded', { count: memories.length, ranked_projects: ranked.length });
+        if (DEBUG) {
+          structuredLog.debug('Recent memories loaded', { count: memories.length, ranked_projects: ranked.length });
+        }
       }
     } else {
       structuredLog.warn('Recent memories fetch failed', { error_message: String(recentResponse.reason) });
@@ -1163,6 +1287,7 @@ export async function handleGetUserContext(args) {
   } catch (error) {
     structuredLog.error('get_user_context: failed', { error_message: error.message });
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Failed to load user context: ${error.message}\n\nMake sure your Purmemo API key is configured.`
@@ -1177,8 +1302,8 @@ export async function handleGetUserContext(args) {
 
 export async function handleRunWorkflow(args) {
   const toolName = 'run_workflow';
-  const requestId = `${toolName}_${Date.now()}_${Math.random().toString(36).substr(2, 6)}`;
   const startTime = Date.now();
+  const requestId = `${toolName}_${startTime}_${Math.random().toString(36).substr(2, 6)}`;
 
   structuredLog.info(`${toolName}: starting`, {
     tool_name: toolName,
@@ -1229,11 +1354,17 @@ export async function handleRunWorkflow(args) {
       };
     }
 
+    // The user-config lookup serves both the user-created workflow check and
+    // the custom prompt override below — fetched at most once per run
+    // (undefined = not fetched yet, null = unavailable)
+    let userConfig;
+    const userConfigPath = `/api/v1/workflow-dashboard/${encodeURIComponent(workflowName)}/user-config`;
+
     // If workflow not in hardcoded templates, it might be a user-created workflow
     // Check the database for it
     if (!template) {
       try {
-        const userConfig = await makeApiCall(`/api/v1/workflow-dashboard/${workflowName}/user-config`);
+        userConfig = await makeApiCall(userConfigPath);
         if (userConfig?.has_custom && userConfig?.prompt) {
           template = {
             name: workflowName,
@@ -1250,6 +1381,7 @@ export async function handleRunWorkflow(args) {
         }
       } catch {
         // Database unavailable — workflow not found
+        userConfig = null;
       }
     }
 
@@ -1262,21 +1394,13 @@ export async function handleRunWorkflow(args) {
       };
     }
 
-    // Check if the user has a custom prompt for this workflow (edits from dashboard)
-    // User's custom prompt always wins over hardcoded default
-    let workflowPrompt = template.prompt;
-    try {
-      const userConfig = await makeApiCall(`/api/v1/workflow-dashboard/${workflowName}/user-config`);
-      if (userConfig?.has_custom && userConfig?.prompt) {
-        workflowPrompt = userConfig.prompt;
-        structuredLog.info(`${toolName}: using user's custom prompt`, {
-          request_id: requestId,
-          workflow: workflowName
-        });
-      }
-    } catch {
-      // Database unavailable — use hardcoded default
-    }
+    // Check if the user has a custom prompt for this workflow (edits from dashboard).
+    // For built-in templates the lookup hasn't run yet — start it now so it
+    // overlaps the preload batch below instead of delaying it.
+    // Database unavailable → null → use hardcoded default.
+    const userConfigPromise = userConfig === undefined
+      ? makeApiCall(userConfigPath).catch(() => null)
+      : Promise.resolve(userConfig);
 
     // Pre-load memories, identity, and (for kickoff) active todos in parallel
     const memoryQueries = buildMemoryQueries(template, input);
@@ -1286,7 +1410,7 @@ export async function handleRunWorkflow(args) {
       (async () => {
         try {
           const [meResponse, sessionResponse] = await Promise.allSettled([
-            makeApiCall('/api/v1/auth/me'),
+            makeCachedApiCall('/api/v1/auth/me', ME_CACHE_TTL_MS),
             makeApiCall('/api/v1/identity/session')
           ]);
           const me = meResponse.status === 'fulfilled' ? meResponse.value : {};
@@ -1305,9 +1429,8 @@ export async function handleRunWorkflow(args) {
       // [1..N] Memories (one call per query)
       ...memoryQueries.map(async (query) => {
         try {
-          const data = await makeApiCall('/api/v10/mcp/tools/execute', {
+          const data = await makeApiCall(TOOLS_EXECUTE_PATH, {
             method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
               tool: 'recall_memories',
               arguments: { query, limit: 3 }
@@ -1344,6 +1467,18 @@ export async function handleRunWorkflow(args) {
     }
 
     const allResults = await Promise.allSettled(parallelCalls);
+
+    // User's custom prompt always wins over hardcoded default
+    userConfig = await userConfigPromise;
+    let workflowPrompt = template.prompt;
+    if (userConfig?.has_custom && userConfig?.prompt) {
+      workflowPrompt = userConfig.prompt;
+      structuredLog.info(`${toolName}: using user's custom prompt`, {
+        request_id: requestId,
+        workflow: workflowName
+      });
+    }
+
     const identityResult = allResults[0];
     const memoryResults = allResults.slice(1, 1 + memoryQueries.length);
     const todosResult = template.preloadTodos ? allResults[allResults.length - 1] : null;
@@ -1438,6 +1573,7 @@ export async function handleRunWorkflow(args) {
     });
 
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Error running workflow: ${error.message}\n\nYou can still use this workflow by describing your task directly — the workflow template provides the structure, and your memories will be loaded when possible.`
@@ -1446,69 +1582,68 @@ export async function handleRunWorkflow(args) {
   }
 }
 
+const WORKFLOW_CATEGORY_LABELS = {
+  product: '📦 Product',
+  strategy: '🎯 Strategy',
+  engineering: '🔧 Engineering',
+  business: '📊 Business',
+  operations: '⚙️ Operations',
+  content: '✍️ Content',
+  custom: '⭐ Your Workflows'
+};
+
+const formatWorkflowLine = (wf) => `  ${wf.name.padEnd(12)} — ${wf.description}\n`;
+
+// The built-in templates never change at runtime, so their per-category
+// listing lines are grouped and formatted once; each call only formats the
+// user's own workflows
+let builtinWorkflowLines = null;
+function getBuiltinWorkflowLines() {
+  if (!builtinWorkflowLines) {
+    builtinWorkflowLines = {};
+    for (const wf of Object.values(WORKFLOW_TEMPLATES)) {
+      builtinWorkflowLines[wf.category] = (builtinWorkflowLines[wf.category] || '') + formatWorkflowLine(wf);
+    }
+  }
+  return builtinWorkflowLines;
+}
+
 export async function handleListWorkflows(args) {
   const toolName = 'list_workflows';
   structuredLog.info(`${toolName}: called`, { category: args.category || 'all' });
 
   // Start with hardcoded presets
-  const workflows = Object.values(WORKFLOW_TEMPLATES);
-  const filtered = args.category
-    ? workflows.filter(wf => wf.category === args.category)
-    : workflows;
-
-  // Group by category
-  const grouped = {};
-  for (const wf of filtered) {
-    const cat = wf.category;
-    if (!grouped[cat]) grouped[cat] = [];
-    grouped[cat].push(wf);
+  const sections = {};
+  for (const [cat, lines] of Object.entries(getBuiltinWorkflowLines())) {
+    if (!args.category || args.category === cat) sections[cat] = lines;
   }
 
   // Fetch user-created workflows from database
-  let userCreatedCount = 0;
   try {
     const apiData = await makeApiCall('/api/v1/workflow-dashboard');
-    if (apiData?.workflows) {
-      const userCreated = apiData.workflows.filter(w => w.is_user_created);
-      if (userCreated.length > 0) {
-        userCreatedCount = userCreated.length;
-        if (!grouped['custom']) grouped['custom'] = [];
-        for (const uw of userCreated) {
-          if (!args.category || args.category === 'custom') {
-            grouped['custom'].push({
-              name: uw.name,
-              description: uw.description || uw.display_name || uw.name
-            });
-          }
-        }
+    if (apiData?.workflows && (!args.category || args.category === 'custom')) {
+      let customLines = '';
+      for (const uw of apiData.workflows) {
+        if (!uw.is_user_created) continue;
+        customLines += formatWorkflowLine({
+          name: uw.name,
+          description: uw.description || uw.display_name || uw.name
+        });
       }
+      if (customLines) sections['custom'] = (sections['custom'] || '') + customLines;
     }
   } catch {
     // Database unavailable — show hardcoded only
   }
 
-  const categoryLabels = {
-    product: '📦 Product',
-    strategy: '🎯 Strategy',
-    engineering: '🔧 Engineering',
-    business: '📊 Business',
-    operations: '⚙️ Operations',
-    content: '✍️ Content',
-    custom: '⭐ Your Workflows'
-  };
-
   let output = `🧠 Purmemo Workflows — Memory-powered processes\n`;
   output += `═══════════════════════════════════════════════\n\n`;
   output += `Each workflow automatically loads your relevant memories and identity.\n`;
   output += `Use: run_workflow(workflow="name", input="what you need")\n\n`;
 
-  for (const [cat, label] of Object.entries(categoryLabels)) {
-    if (!grouped[cat] || grouped[cat].length === 0) continue;
-    output += `${label}\n`;
-    for (const wf of grouped[cat]) {
-      output += `  ${wf.name.padEnd(12)} — ${wf.description}\n`;
-    }
-    output += `\n`;
+  for (const [cat, label] of Object.entries(WORKFLOW_CATEGORY_LABELS)) {
+    if (!sections[cat]) continue;
+    output += `${label}\n${sections[cat]}\n`;
   }
 
   output += `Or just describe what you need:\n`;
@@ -1532,14 +1667,14 @@ export async function handleShareMemory(args) {
   structuredLog.info(`[${requestId}] share_memory called`, { memory_id: memoryId, visibility: args.visibility });
 
   if (!memoryId) {
-    return { content: [{ type: 'text', text: `❌ Missing required parameter: memory_id` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Missing required parameter: memory_id` }] };
   }
 
   try {
-    const response = await makeApiCall(`/api/v1/memories/${memoryId}/visibility`, {
+    const response = await makeApiCall(memoryPath(memoryId, '/visibility'), {
       method: 'PATCH',
       body: JSON.stringify({ visibility: args.visibility })
-    });
+    }).finally(invalidateRecallCache);
 
     const data = typeof response === 'string' ? JSON.parse(response) : response;
 
@@ -1567,9 +1702,9 @@ export async function handleShareMemory(args) {
     structuredLog.error(`[${requestId}] share_memory failed`, { error: error.message });
     const errorMsg = error.message || String(error);
     if (errorMsg.includes('429') || errorMsg.includes('limit')) {
-      return { content: [{ type: 'text', text: `⚠️ Share limit reached for this month.\n\nFree tier allows 5 shares/month. Upgrade to Pro ($19/mo) for unlimited sharing → https://app.purmemo.ai/settings` }] };
+      return { isError: true, content: [{ type: 'text', text: `⚠️ Share limit reached for this month.\n\nFree tier allows 5 shares/month. Upgrade to Pro ($19/mo) for unlimited sharing → https://app.purmemo.ai/settings` }] };
     }
-    return { content: [{ type: 'text', text: `❌ Failed to update visibility: ${errorMsg}` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Failed to update visibility: ${errorMsg}` }] };
   }
 }
 
@@ -1586,7 +1721,7 @@ export async function handleRecallPublic(args) {
     params.set('page', String(args.page || 1));
     params.set('page_size', '10');
 
-    const response = await makeApiCall(`/api/v1/memories/public?${params.toString()}`, {
+    const response = await makeApiCall(`${PUBLIC_MEMORIES_PATH}?${params.toString()}`, {
       method: 'GET'
     });
 
@@ -1635,7 +1770,7 @@ export async function handleRecallPublic(args) {
     return { content: [{ type: 'text', text: output }] };
   } catch (error) {
     structuredLog.error(`[${requestId}] recall_public failed`, { error: error.message });
-    return { content: [{ type: 'text', text: `❌ Failed to search public memories: ${error.message || String(error)}` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Failed to search public memories: ${error.message || String(error)}` }] };
   }
 }
 
@@ -1645,18 +1780,18 @@ export async function handleGetPublicMemory(args) {
   structuredLog.info(`[${requestId}] get_public_memory called`, { memory_id: memoryId });
 
   if (!memoryId) {
-    return { content: [{ type: 'text', text: `❌ Missing required parameter: memory_id` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Missing required parameter: memory_id` }] };
   }
 
   try {
-    const response = await makeApiCall(`/api/v1/memories/public/${memoryId}`, {
+    const response = await makeApiCall(publicMemoryPath(memoryId), {
       method: 'GET'
     });
 
     const data = typeof response === 'string' ? JSON.parse(response) : response;
 
     if (!data || !data.id) {
-      return { content: [{ type: 'text', text: `❌ Memory \`${memoryId}\` not found or is not public.` }] };
+      return { isError: true, content: [{ type: 'text', text: `❌ Memory \`${memoryId}\` not found or is not public.` }] };
     }
 
     const platformEmoji = {
@@ -1695,9 +1830,9 @@ export async function handleGetPublicMemory(args) {
     structuredLog.error(`[${requestId}] get_public_memory failed`, { error: error.message });
     const errorMsg = error.message || String(error);
     if (errorMsg.includes('404')) {
-      return { content: [{ type: 'text', text: `❌ Memory \`${memoryId}\` not found or is not public.` }] };
+      return { isError: true, content: [{ type: 'text', text: `❌ Memory \`${memoryId}\` not found or is not public.` }] };
     }
-    return { content: [{ type: 'text', text: `❌ Failed to retrieve public memory: ${errorMsg}` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Failed to retrieve public memory: ${errorMsg}` }] };
   }
 }
 
@@ -1707,11 +1842,11 @@ export async function handleReportMemory(args) {
   structuredLog.info(`[${requestId}] report_memory called`, { memory_id: memoryId, reason: args.reason });
 
   if (!memoryId) {
-    return { content: [{ type: 'text', text: `❌ Missing required parameter: memory_id` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Missing required parameter: memory_id` }] };
   }
 
   try {
-    const response = await makeApiCall(`/api/v1/memories/${memoryId}/report`, {
+    const response = await makeApiCall(memoryPath(memoryId, '/report'), {
       method: 'POST',
       body: JSON.stringify({
         reason: args.reason,
@@ -1733,7 +1868,7 @@ export async function handleReportMemory(args) {
     if (errorMsg.includes('409') || errorMsg.includes('already reported')) {
       return { content: [{ type: 'text', text: `ℹ️ You have already reported this memory. Our team will review it.` }] };
     }
-    return { content: [{ type: 'text', text: `❌ Failed to report memory: ${errorMsg}` }] };
+    return { isError: true, content: [{ type: 'text', text: `❌ Failed to report memory: ${errorMsg}` }] };
   }
 }
 
@@ -1743,8 +1878,14 @@ export async function handleGetAcknowledgedErrors(args) {
     const levelFilter = args.level_filter || 'all';
     const minOccurrences = args.min_occurrences || 1;
 
+    const params = new URLSearchParams({
+      limit: String(limit),
+      level_filter: String(levelFilter),
+      min_occurrences: String(minOccurrences)
+    });
+
     const response = await makeApiCall(
-      `/api/v1/admin/acknowledged-errors?limit=${limit}&level_filter=${levelFilter}&min_occurrences=${minOccurrences}`,
+      `/api/v1/admin/acknowledged-errors?${params.toString()}`,
       { method: 'GET' }
     );
 
@@ -1809,6 +1950,7 @@ export async function handleGetAcknowledgedErrors(args) {
 
   } catch (error) {
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Error fetching acknowledged errors: ${error.message}\n\nMake sure:\n1. Backend API is running\n2. You have admin permissions\n3. Error tracking service is active`
@@ -1821,6 +1963,7 @@ export async function handleSaveInvestigation(args) {
   try {
     if (!args.incident_id) {
       return {
+        isError: true,
         content: [{
           type: 'text',
           text: `❌ Missing required field: incident_id\n\nPlease provide the incident_id from get_acknowledged_errors.`
@@ -1856,6 +1999,7 @@ export async function handleSaveInvestigation(args) {
       userMessage = 'Incident not found. Please verify the incident_id exists in get_acknowledged_errors.';
     }
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Error saving investigation: ${userMessage}\n\nPlease check:\n1. incident_id is valid (from get_acknowledged_errors)\n2. Backend API is running\n3. You have admin permissions`
@@ -18,7 +18,7 @@
  * Uses existing V2 extraction data — no new tables, no new LLM calls.
  */
 
-import { structuredLog } from '../lib/logger.js';
+import { structuredLog, DEBUG } from '../lib/logger.js';
 import { makeApiCall, safeErrorMessage } from '../lib/api-client.js';
 
 // ============================================================================
@@ -374,9 +374,10 @@ function assembleBrief(memories: Memory[], todos: Todo[], projectFilter?: string
     return 'No recent activity found. Start a conversation and save it to build your handoff brief.';
   }
 
-  // Filter by project if specified
-  const filtered = projectFilter
-    ? memories.filter(m => m.project_name?.toLowerCase().includes(projectFilter.toLowerCase()))
+  // Filter by project if specified (needle lowercased once, not per memory)
+  const needle = projectFilter?.toLowerCase();
+  const filtered = needle
+    ? memories.filter(m => m.project_name?.toLowerCase().includes(needle))
     : memories;
 
   // Fall back to unfiltered if project filter yields nothing
@@ -446,7 +447,9 @@ export async function handleGenerateHandoffBrief(args: {
       const data = memoriesResponse.value;
       const raw = Array.isArray(data) ? data : (data.memories || []);
       memories = raw as Memory[];
-      structuredLog.debug(`${toolName}: loaded ${memories.length} memories`, { request_id: requestId });
+      if (DEBUG) {
+        structuredLog.debug(`${toolName}: loaded ${memories.length} memories`, { request_id: requestId });
+      }
     } else {
       structuredLog.warn(`${toolName}: memories fetch failed`, {
         request_id: requestId,
@@ -460,7 +463,9 @@ export async function handleGenerateHandoffBrief(args: {
       const data = todosResponse.value;
       const raw = Array.isArray(data) ? data : (data.todos || []);
       todos = raw as Todo[];
-      structuredLog.debug(`${toolName}: loaded ${todos.length} todos`, { request_id: requestId });
+      if (DEBUG) {
+        structuredLog.debug(`${toolName}: loaded ${todos.length} todos`, { request_id: requestId });
+      }
     } else {
       structuredLog.warn(`${toolName}: todos fetch failed`, {
         request_id: requestId,
@@ -490,6 +495,7 @@ export async function handleGenerateHandoffBrief(args: {
       error_message: safeErrorMessage(error),
     });
     return {
+      isError: true,
       content: [{
         type: 'text',
         text: `❌ Error generating handoff brief: ${safeErrorMessage(error)}`,
@@ -322,6 +322,7 @@ export interface ConnectionInfo {
   connectedAt: number;
   lastActivity: number;
   toolCalls: Record<string, number>;
+  totalToolCalls: number;
   errors: number;
 }
 
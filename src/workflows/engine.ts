@@ -460,23 +460,30 @@ This persists the brief so the user (or another AI agent) can recall it later wi
   }
 };
 
+// Signal lookup table in match priority order — first match wins (order
+// matters: emergency first). Built once from the static templates instead of
+// re-deriving the order and template lookups on every classification.
+const SIGNAL_TABLE = [
+  'incident', 'debug', 'deploy', 'review',  // urgent/engineering
+  'kickoff',                                  // todo launch
+  'prd', 'story', 'design', 'roadmap',       // product
+  'ceo', 'growth', 'metrics', 'intel',       // strategy/business
+  'sprint', 'copy', 'feedback'               // operations/content
+].map(name => ({
+  name,
+  signals: WORKFLOW_TEMPLATES[name].signals,
+  chain: WORKFLOW_TEMPLATES[name].route_chain
+}));
+
 // Intent classifier for auto-routing when no workflow is specified
 export function classifyWorkflowIntent(input) {
   const lower = input.toLowerCase();
 
-  // Check each workflow's signals — first match wins (order matters: emergency first)
-  const priorityOrder = [
-    'incident', 'debug', 'deploy', 'review',  // urgent/engineering
-    'kickoff',                                  // todo launch
-    'prd', 'story', 'design', 'roadmap',       // product
-    'ceo', 'growth', 'metrics', 'intel',       // strategy/business
-    'sprint', 'copy', 'feedback'               // operations/content
-  ];
-
-  for (const wfName of priorityOrder) {
-    const wf = WORKFLOW_TEMPLATES[wfName];
-    if (wf.signals.some(signal => lower.includes(signal))) {
-      return { workflow: wfName, confidence: 'high', chain: wf.route_chain };
+  for (const { name, signals, chain } of SIGNAL_TABLE) {
+    for (const signal of signals) {
+      if (lower.includes(signal)) {
+        return { workflow: name, confidence: 'high', chain };
+      }
     }
   }
 
@@ -0,0 +1,100 @@
+/**
+ * Remote (HTTP) mode smoke tests
+ * Starts the built server with --remote and requests its static pages.
+ * Uses Node.js built-in test runner (no extra dependencies)
+ */
+
+import { describe, it, before, after } from 'node:test';
+import assert from 'node:assert';
+import { spawn } from 'node:child_process';
+import { access } from 'node:fs/promises';
+import { createServer } from 'node:net';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const SERVER_PATH = join(__dirname, '..', 'dist', 'server.js');
+const STARTUP_TIMEOUT_MS = 10000;
+
+function getFreePort() {
+  return new Promise((resolve, reject) => {
+    const srv = createServer();
+    srv.once('error', reject);
+    srv.listen(0, '127.0.0.1', () => {
+      const { port } = srv.address();
+      srv.close(() => resolve(port));
+    });
+  });
+}
+
+async function waitForServer(baseUrl, child) {
+  const deadline = Date.now() + STARTUP_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    if (child.exitCode !== null) throw new Error(`server exited with code ${child.exitCode}`);
+    try {
+      const res = await fetch(`${baseUrl}/login`);
+      await res.arrayBuffer();
+      return;
+    } catch {
+      await new Promise(resolve => setTimeout(resolve, 100));
+    }
+  }
+  throw new Error('server did not start in time');
+}
+
+describe('Remote Server', () => {
+  let child;
+  let baseUrl;
+
+  before(async () => {
+    await access(SERVER_PATH);
+    const port = await getFreePort();
+    baseUrl = `http://127.0.0.1:${port}`;
+    child = spawn(process.execPath, [SERVER_PATH, '--remote'], {
+      env: {
+        ...process.env,
+        PORT: String(port),
+        PURMEMO_API_KEY: 'test-api-key',
+        // Unroutable backend: startup's version check fails fast and is ignored
+        PURMEMO_API_URL: 'http://127.0.0.1:9'
+      },
+      stdio: 'ignore'
+    });
+    await waitForServer(baseUrl, child);
+  });
+
+  after(() => {
+    child?.kill();
+  });
+
+  describe('Static pages', () => {
+    it('should serve the login page with params injected', async () => {
+      const res = await fetch(`${baseUrl}/login?params=abc123`);
+      const html = await res.text();
+
+      assert.strictEqual(res.status, 200);
+      assert.match(res.headers.get('content-type'), /text\/html/);
+      assert.ok(html.includes('name="params" value="abc123"'), 'Params should be injected into the form');
+      assert.ok(!html.includes('<!-- PARAMS -->'), 'No placeholder should be left behind');
+    });
+
+    it('should serve the login page repeatedly from the asset cache', async () => {
+      const first = await (await fetch(`${baseUrl}/login?params=one`)).text();
+      const second = await (await fetch(`${baseUrl}/login?params=two`)).text();
+
+      assert.ok(first.includes('value="one"'));
+      assert.ok(second.includes('value="two"'));
+      assert.ok(!second.includes('value="one"'), 'Earlier params must not leak into later renders');
+    });
+
+    it('should serve the icon', async () => {
+      const res = await fetch(`${baseUrl}/favicon.ico`);
+      const body = await res.arrayBuffer();
+
+      assert.strictEqual(res.status, 200);
+      assert.ok(body.byteLength > 0, 'Icon should not be empty');
+    });
+  });
+});
@@ -160,6 +160,149 @@ describe('Purmemo MCP Server', () => {
     });
   });
 
+  describe('RingBuffer', () => {
+    let RingBuffer;
+
+    before(async () => {
+      const module = await import(join(__dirname, '..', 'dist', 'lib', 'ring-buffer.js'));
+      RingBuffer = module.RingBuffer;
+    });
+
+    it('should keep only the newest entries once full', () => {
+      const buf = new RingBuffer(3);
+      for (let i = 1; i <= 5; i++) buf.push(i);
+
+      assert.strictEqual(buf.length, 3);
+      assert.deepStrictEqual(Array.from(buf), [3, 4, 5]);
+    });
+
+    it('should return the newest n entries oldest-first', () => {
+      const buf = new RingBuffer(4);
+      [1, 2, 3].forEach(i => buf.push(i));
+
+      assert.deepStrictEqual(buf.last(2), [2, 3]);
+      assert.deepStrictEqual(buf.last(10), [1, 2, 3]);
+    });
+  });
+
+  describe('mapWithConcurrency', () => {
+    let mapWithConcurrency;
+
+    before(async () => {
+      const module = await import(join(__dirname, '..', 'dist', 'tools', 'handlers.js'));
+      mapWithConcurrency = module.mapWithConcurrency;
+    });
+
+    it('should not start new items after the first failure', async () => {
+      const started = [];
+      const items = Array.from({ length: 10 }, (_, i) => i);
+
+      await assert.rejects(
+        mapWithConcurrency(items, 2, async (item) => {
+          started.push(item);
+          await new Promise(resolve => setTimeout(resolve, 5));
+          if (item === 1) throw new Error('part upload failed');
+          return item;
+        }),
+        /part upload failed/
+      );
+      // Give any still-running worker time to pick up more work
+      await new Promise(resolve => setTimeout(resolve, 30));
+
+      assert.ok(started.length <= 3, `expected at most 3 items started, got ${started.length}`);
+    });
+  });
+
+  describe('Batch Execute', () => {
+    let executeBatch, BATCH_MAX_OPERATIONS, BATCH_MAX_CONCURRENCY;
+
+    before(async () => {
+      const module = await import(join(__dirname, '..', 'dist', 'tools', 'batch.js'));
+      executeBatch = module.executeBatch;
+      BATCH_MAX_OPERATIONS = module.BATCH_MAX_OPERATIONS;
+      BATCH_MAX_CONCURRENCY = module.BATCH_MAX_CONCURRENCY;
+    });
+
+    const textResult = (text, isError = false) => ({ isError, content: [{ type: 'text', text }] });
+    const parseEntries = (result) => JSON.parse(result.content[0].text);
+    const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+    it('should return results in input order regardless of completion order', async () => {
+      const delays = [30, 5, 20, 0];
+      const operations = delays.map((delay, i) => ({ name: 'recall_memories', arguments: { delay, i } }));
+
+      const result = await executeBatch({ operations }, async (name, args) => {
+        await sleep(args.delay);
+        return textResult(`op ${args.i}`);
+      });
+
+      assert.ok(!result.isError);
+      assert.deepStrictEqual(parseEntries(result).map(e => e.text), ['op 0', 'op 1', 'op 2', 'op 3']);
+    });
+
+    it('should keep at most maxConcurrent operations in flight', async () => {
+      let inFlight = 0;
+      let peak = 0;
+      const dispatch = async () => {
+        peak = Math.max(peak, ++inFlight);
+        await sleep(5);
+        inFlight--;
+        return textResult('ok');
+      };
+      const operations = Array.from({ length: 10 }, () => ({ name: 'recall_memories' }));
+
+      await executeBatch({ operations, maxConcurrent: 2 }, dispatch);
+      assert.strictEqual(peak, 2);
+
+      peak = 0;
+      await executeBatch({ operations, maxConcurrent: 100 }, dispatch);
+      assert.strictEqual(peak, BATCH_MAX_CONCURRENCY, 'maxConcurrent should be clamped');
+
+      peak = 0;
+      await executeBatch({ operations, maxConcurrent: 0 }, dispatch);
+      assert.strictEqual(peak, 1, 'maxConcurrent 0 should be clamped to 1');
+    });
+
+    it('should reject nested batches without dispatching them', async () => {
+      const dispatched = [];
+      const result = await executeBatch({
+        operations: [{ name: 'batch_execute', arguments: { operations: [] } }, { name: 'list_workflows' }]
+      }, async (name) => {
+        dispatched.push(name);
+        return textResult('ok');
+      });
+
+      const entries = parseEntries(result);
+      assert.strictEqual(entries[0].isError, true);
+      assert.match(entries[0].text, /cannot be nested/);
+      assert.strictEqual(entries[1].isError, false);
+      assert.deepStrictEqual(dispatched, ['list_workflows']);
+    });
+
+    it('should reject empty, missing and oversized operation lists', async () => {
+      const dispatch = async () => textResult('ok');
+      const tooMany = Array.from({ length: BATCH_MAX_OPERATIONS + 1 }, () => ({ name: 'recall_memories' }));
+
+      for (const args of [{ operations: [] }, {}, { operations: 'recall_memories' }, { operations: tooMany }]) {
+        const result = await executeBatch(args, dispatch);
+        assert.strictEqual(result.isError, true);
+        assert.match(result.content[0].text, new RegExp(`between 1 and ${BATCH_MAX_OPERATIONS} operations`));
+      }
+    });
+
+    it('should report failures per operation from isError and thrown errors', async () => {
+      const result = await executeBatch({
+        operations: [{ name: 'save_conversation' }, { name: 'recall_memories' }, { name: 'get_memory_details' }, {}]
+      }, async (name) => {
+        if (name === 'save_conversation') return textResult('❌ Save Error: boom', true);
+        if (name === 'get_memory_details') throw new Error('network down');
+        return textResult('found it');
+      });
+
+      assert.deepStrictEqual(parseEntries(result).map(e => e.isError), [true, false, true, true]);
+    });
+  });
+
   describe('Tool Definitions', () => {
     it('should define required MCP tools', async () => {
       // We test that the server exports expected tool names